@@ -1,5 +1,6 @@
 """Anthropic Claude AI client implementation."""
 
+from types import ModuleType
 from typing import Generator, Optional
 import logging
 
@@ -10,6 +11,12 @@ from .base import AIClient, AIResponse, StreamChunk
 CLAUDE_PREFIXES = ("claude-", "claude_")
 
 
+def _import_sdk() -> ModuleType:
+    """Import and return the Anthropic SDK module."""
+    import anthropic
+    return anthropic
+
+
 class ClaudeClient(AIClient):
     """Client for Anthropic's Claude API."""
     
@@ -25,7 +32,7 @@ class ClaudeClient(AIClient):
         """
         if self._client is None:
             try:
-                import anthropic
+                anthropic = _import_sdk()
                 self._client = anthropic.Anthropic(
                     api_key=self.api_key,
                     timeout=60.0  # Explicit timeout
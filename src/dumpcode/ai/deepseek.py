@@ -1,5 +1,6 @@
 """DeepSeek AI client implementation."""
 
+from types import ModuleType
 from typing import Generator, Optional
 import logging
 
@@ -10,6 +11,12 @@ DEEPSEEK_PREFIXES = ("deepseek-", "deepseek_")
 DEEPSEEK_BASE_URL = "https://api.deepseek.com"
 
 
+def _import_sdk() -> ModuleType:
+    """Import and return the OpenAI SDK module."""
+    import openai
+    return openai
+
+
 class DeepSeekClient(AIClient):
     """Client for DeepSeek's API (OpenAI-compatible)."""
     
@@ -25,8 +32,8 @@ class DeepSeekClient(AIClient):
         """
         if self._client is None:
             try:
-                from openai import OpenAI
-                self._client = OpenAI(
+                openai = _import_sdk()
+                self._client = openai.OpenAI(
                     api_key=self.api_key,
                     base_url=DEEPSEEK_BASE_URL,
                     timeout=60.0  # Explicit timeout
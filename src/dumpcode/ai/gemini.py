@@ -1,5 +1,6 @@
 """Google Gemini AI client implementation."""
 
+from types import ModuleType
 from typing import Generator, Optional, Any
 import logging
 
@@ -9,6 +10,16 @@ from .base import AIClient, AIResponse, StreamChunk
 GEMINI_PREFIXES = ("gemini-", "gemini_")
 
 
+def _import_sdk() -> ModuleType:
+    """Import and return the Google Generative AI SDK module."""
+    import warnings
+    # Silence the google-generativeai deprecation warning
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", FutureWarning)
+        import google.generativeai as genai
+    return genai
+
+
 class GeminiClient(AIClient):
     """Client for Google's Gemini API."""
     
@@ -27,12 +38,7 @@ class GeminiClient(AIClient):
         """
         if model not in self._model_cache:
             try:
-                import warnings
-                # Silence the google-generativeai deprecation warning
-                with warnings.catch_warnings():
-                    warnings.simplefilter("ignore", FutureWarning)
-                    import google.generativeai as genai
-                
+                genai = _import_sdk()
                 genai.configure(api_key=self.api_key)
                 self._model_cache[model] = genai.GenerativeModel(model)
             except (ImportError, AttributeError):
@@ -1,5 +1,6 @@
 """OpenAI GPT client implementation."""
 
+from types import ModuleType
 from typing import Generator, Optional
 import logging
 
@@ -9,6 +10,12 @@ from .base import AIClient, AIResponse, StreamChunk
 GPT_PREFIXES = ("gpt-", "gpt_", "o1", "o3", "o4")
 
 
+def _import_sdk() -> ModuleType:
+    """Import and return the OpenAI SDK module."""
+    import openai
+    return openai
+
+
 class OpenAIClient(AIClient):
     """Client for OpenAI's GPT API."""
     
@@ -24,8 +31,8 @@ class OpenAIClient(AIClient):
         """
         if self._client is None:
             try:
-                from openai import OpenAI
-                self._client = OpenAI(
+                openai = _import_sdk()
+                self._client = openai.OpenAI(
                     api_key=self.api_key,
                     timeout=60.0  # Explicit timeout
                 )
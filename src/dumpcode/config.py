@@ -1,12 +1,20 @@
 """Configuration management for DumpCode."""
 
+import functools
 import json
 import logging
 from pathlib import Path
+from types import ModuleType
 from typing import Any, Dict, Optional
 
 from .constants import CONFIG_FILENAME, DEFAULT_PROFILES
 
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 DEFAULT_CONFIG = {
     "version": 1,
     "ignore_patterns": [
@@ -18,11 +26,44 @@ DEFAULT_CONFIG = {
         "ai_response.md",
     ],
     "include_patterns": [],
-    "profiles": DEFAULT_PROFILES,
+    "profiles": dict(DEFAULT_PROFILES),
     "use_xml": True
 }
 
 
+def _read_json(path: Path) -> Any:
+    """Parse a JSON file, using orjson when it is installed.
+
+    Args:
+        path: File to read.
+
+    Returns:
+        The decoded JSON document.
+    """
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Serialize data to a JSON file using the project's 4-space layout.
+
+    Args:
+        path: File to write.
+        data: JSON-serializable document.
+    """
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=4)
+
+
+PROFILE_KEYS = frozenset({
+    "description", "pre", "post", "run_commands",
+    "additional_excludes", "additional_includes",
+})
+"""Keys that mark a dict as a profile; validate_config requires at least one."""
+
+
 def validate_config(config: Dict) -> bool:
     """Basic structural check for configuration.
 
@@ -50,12 +91,7 @@ def validate_config(config: Dict) -> bool:
         if not isinstance(body, dict):
             return False
 
-        valid_keys = {
-            "description", "pre", "post", "run_commands",
-            "additional_excludes", "additional_includes",
-        }
-
-        if not any(key in body for key in valid_keys):
+        if PROFILE_KEYS.isdisjoint(body):
             return False
 
         if "additional_excludes" in body:
@@ -69,6 +105,9 @@ def validate_config(config: Dict) -> bool:
     return True
 
 
+_SENSITIVE_PARENTS = ("/bin", "/sbin", "/etc", "/usr", "/var", "/root", "/boot", "/dev")
+
+
 def is_safe_to_create_config(root_path: Path) -> bool:
     """Check if the directory is a sensitive system path to prevent accidental config creation.
     
@@ -78,14 +117,17 @@ def is_safe_to_create_config(root_path: Path) -> bool:
     Returns:
         True if the path is considered safe, False if it is a sensitive system directory.
     """
-    abs_path = root_path.resolve()
-    sensitive_parents = {"/bin", "/sbin", "/etc", "/usr", "/var", "/root", "/boot", "/dev"}
+    return _is_safe_resolved_path(str(root_path.resolve()), str(Path.home()))
 
-    if abs_path == Path.home() or abs_path == Path("/"):
+
+@functools.lru_cache(maxsize=256)
+def _is_safe_resolved_path(path_str: str, home_str: str) -> bool:
+    """Cached core of is_safe_to_create_config, keyed on resolved path and home."""
+    abs_path = Path(path_str)
+    if abs_path == Path(home_str) or abs_path == Path("/"):
         return False
 
-    path_str = str(abs_path)
-    return not any(path_str.startswith(s) for s in sensitive_parents)
+    return not path_str.startswith(_SENSITIVE_PARENTS)
 
 
 def load_or_create_config(
@@ -105,12 +147,12 @@ def load_or_create_config(
     """
     config_path = root_path / CONFIG_FILENAME
     config = DEFAULT_CONFIG.copy()
+    config["profiles"] = dict(DEFAULT_PROFILES)
 
     if config_path.exists():
         try:
-            with open(config_path, "r", encoding="utf-8") as f:
-                loaded_config = json.load(f)
-                
+            loaded_config = _read_json(config_path)
+
             if not validate_config(loaded_config):
                 if logger:
                     logger.warning("Config file has invalid structure, using defaults")
@@ -138,8 +180,7 @@ def load_or_create_config(
 
     if config_path.exists() or is_safe_to_create_config(root_path):
         try:
-            with open(config_path, "w", encoding="utf-8") as f:
-                json.dump(config, f, indent=4)
+            _write_json(config_path, config)
         except Exception as e:
             if logger:
                 logger.error(f"Could not save config: {e}")
@@ -161,8 +202,7 @@ def increment_config_version(root_path: Path, logger: Optional[logging.Logger] =
         return
     
     try:
-        with open(config_path, "r", encoding="utf-8") as f:
-            config = json.load(f)
+        config = _read_json(config_path)
         
         current_version = config.get("version", 0)
         if isinstance(current_version, (int, float)):
@@ -170,8 +210,7 @@ def increment_config_version(root_path: Path, logger: Optional[logging.Logger] =
         else:
             config["version"] = 1
         
-        with open(config_path, "w", encoding="utf-8") as f:
-            json.dump(config, f, indent=4)
+        _write_json(config_path, config)
     except Exception as e:
         if logger:
             logger.error(f"Could not increment config version: {e}")
@@ -210,10 +249,9 @@ def interactive_init(root_path: Path) -> None:
     config = {
         "version": 1,
         "ignore_patterns": list(set(ignores)),
-        "profiles": DEFAULT_PROFILES,
+        "profiles": dict(DEFAULT_PROFILES),
         "use_xml": use_xml
     }
 
-    with open(config_path, "w", encoding="utf-8") as f:
-        json.dump(config, f, indent=4)
+    _write_json(config_path, config)
     print(f"✅ Created {CONFIG_FILENAME}")
\ No newline at end of file
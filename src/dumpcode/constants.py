@@ -1,5 +1,7 @@
 """Constants and default configuration profiles for DumpCode."""
 
+from types import MappingProxyType
+
 CONFIG_FILENAME = ".dump_config.json"
 
 # Updated default model baseline
@@ -19,7 +21,7 @@ DEFAULT_POST = [
 # - Claude Sonnet: Excellent writing and code understanding
 # - GPT-5.2: Strong general-purpose, good at structured output
 
-DEFAULT_PROFILES = {
+DEFAULT_PROFILES = MappingProxyType({
     "readme": {
         "description": "Generate a professional, architect-level README.md for the current project",
         "pre": [
@@ -221,4 +223,5 @@ DEFAULT_PROFILES = {
         "model": DEFAULT_MODEL,
         "auto_send": False
     }
-}
\ No newline at end of file
+})
+"""Built-in profiles, read-only. Copy (e.g. ``dict(DEFAULT_PROFILES)``) before mutating or serializing."""
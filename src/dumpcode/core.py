@@ -2,14 +2,22 @@
 
 import fnmatch
 import os
+import re
+import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set, Tuple, Union
 
 from .constants import CONFIG_FILENAME
 from .utils import get_git_modified_files
 
 
+_GLOB_CHARS = "*?[\\"
+
+# dataclass(slots=True) needs Python 3.10; older interpreters keep per-instance dicts
+_DATACLASS_SLOTS: Dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
 @dataclass
 class DumpSettings:
     """Container for dump execution parameters.
@@ -98,9 +106,11 @@ class DumpSettings:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TreeEntry:
     """Represents a single entry in the directory tree structure.
+
+    Uses __slots__ where supported, since a session holds one entry per path.
     
     Attributes:
         path: Full path to the file or directory
@@ -146,6 +156,7 @@ class DumpSession:
             included_patterns: Patterns that override exclusions (force-include).
         """
         self.root_path = root_path
+        self._root_prefix = os.path.join(os.fspath(root_path), "")
         self.excluded_patterns = excluded_patterns
         self.max_depth = max_depth
         self.dir_only = dir_only
@@ -157,9 +168,20 @@ class DumpSession:
         self.tree_entries: List[TreeEntry] = []
         self.files_to_dump: List[Path] = []
         self.skipped_files: List[Dict[str, str]] = []
-        self.visited_paths: Set[Path] = set()
-        self.matcher = self._create_combined_matcher(root_path, excluded_patterns)
+        self.visited_paths: Set[str] = set()
+        all_patterns = list(excluded_patterns) + self._load_gitignore_lines(root_path)
+        self.matcher = self._create_combined_matcher(all_patterns)
+        self._exact_excludes = (
+            self._compile_exact_excludes(all_patterns) if self.matcher else frozenset()
+        )
+        self._dir_prune_names = (
+            self._compile_dir_prune_names(all_patterns) if self.matcher else frozenset()
+        )
+        self._match_prefilter = (
+            self._compile_match_prefilter(all_patterns) if self.matcher else None
+        )
         self.include_matcher = self._create_include_matcher(self.included_patterns)
+        self._include_prefixes = self._compile_include_prefixes(self.included_patterns)
 
     def _load_gitignore_lines(self, root_path: Path) -> List[str]:
         """Load .gitignore file lines.
@@ -185,18 +207,15 @@ class DumpSession:
             pass
         return lines
 
-    def _create_combined_matcher(self, root_path: Path, excluded_patterns: Set[str]) -> Any:
+    def _create_combined_matcher(self, all_patterns: List[str]) -> Any:
         """Create a combined pathspec matcher from excluded_patterns and .gitignore.
         
         Args:
-            root_path: Base directory for the dump.
-            excluded_patterns: Set of glob patterns to ignore.
+            all_patterns: Excluded patterns followed by .gitignore lines.
             
         Returns:
             A pathspec.PathSpec instance if pathspec is available, otherwise None.
         """
-        all_patterns = list(excluded_patterns) + self._load_gitignore_lines(root_path)
-        
         if not all_patterns:
             return None
             
@@ -206,6 +225,126 @@ class DumpSession:
         except ImportError:
             return None
 
+    def _literal_patterns(self, all_patterns: List[str]) -> List[str]:
+        """Select the exclusion patterns that contain no wildcard or escape syntax.
+
+        Args:
+            all_patterns: Excluded patterns followed by .gitignore lines.
+
+        Returns:
+            Literal patterns, or an empty list when any negation pattern is present,
+            since a later '!' rule could re-include a literal match.
+        """
+        if any(pattern.startswith("!") for pattern in all_patterns):
+            return []
+
+        return [
+            pattern for pattern in all_patterns
+            if pattern
+            and pattern == pattern.strip()
+            and not pattern.startswith("#")
+            and not any(char in pattern for char in _GLOB_CHARS)
+        ]
+
+    def _compile_exact_excludes(self, all_patterns: List[str]) -> FrozenSet[str]:
+        """Collect wildcard-free exclusion patterns for a hash lookup fast path.
+
+        Args:
+            all_patterns: Excluded patterns followed by .gitignore lines.
+
+        Returns:
+            Relative paths excluded verbatim.
+        """
+        return frozenset(
+            pattern[1:] if pattern.startswith("/") else pattern
+            for pattern in self._literal_patterns(all_patterns)
+            if not pattern.endswith("/")
+        )
+
+    def _compile_dir_prune_names(self, all_patterns: List[str]) -> FrozenSet[str]:
+        """Collect directory names that are excluded at any depth.
+
+        A literal pattern without any slash ('node_modules') matches a directory of
+        that name anywhere in the tree, so such directories can be pruned by name
+        without consulting pathspec. Trailing-slash rules ('venv/') are left to
+        pathspec: is_excluded checks directories without a trailing slash, so
+        those rules hide the directory's contents but not its own tree entry.
+
+        Args:
+            all_patterns: Excluded patterns followed by .gitignore lines.
+
+        Returns:
+            Directory base names to prune.
+        """
+        return frozenset(
+            pattern for pattern in self._literal_patterns(all_patterns)
+            if "/" not in pattern
+        )
+
+    def _compile_match_prefilter(
+        self, all_patterns: List[str]
+    ) -> Optional[Tuple[FrozenSet[str], FrozenSet[str], Tuple[str, ...]]]:
+        """Summarise exclusion patterns so most non-matching paths skip pathspec.
+
+        Every positive pattern must reduce to a literal first path segment, a
+        literal component name, or a '*<suffix>' component glob. Negations are
+        ignored: they can only re-include paths, never exclude new ones.
+
+        Args:
+            all_patterns: Excluded patterns followed by .gitignore lines.
+
+        Returns:
+            (first segments, component names, component suffixes), or None when a
+            pattern is too general to summarise and every path must be matched.
+        """
+        first_segments = set()
+        names = set()
+        suffixes = set()
+        for pattern in all_patterns:
+            if not pattern or pattern.startswith(("#", "!")):
+                continue
+            if pattern != pattern.strip():
+                return None
+
+            body = pattern.rstrip("/")
+            anchored = body.startswith("/") or "/" in body.lstrip("/")
+            body = body.lstrip("/")
+            if not body:
+                return None
+            first = body.split("/", 1)[0]
+
+            if anchored and not any(char in first for char in _GLOB_CHARS):
+                first_segments.add(first)
+            elif not anchored and not any(char in body for char in _GLOB_CHARS):
+                names.add(body)
+            elif (
+                not anchored
+                and body.startswith("*")
+                and body[1:]
+                and not any(char in body[1:] for char in _GLOB_CHARS)
+            ):
+                suffixes.add(body[1:])
+            else:
+                return None
+        return frozenset(first_segments), frozenset(names), tuple(suffixes)
+
+    def _may_match(self, rel_path: str) -> bool:
+        """Cheaply rule out paths that no exclusion pattern can match.
+
+        Args:
+            rel_path: The relative path (POSIX format) to check.
+
+        Returns:
+            False only when the prefilter proves no pattern matches the path.
+        """
+        if self._match_prefilter is None:
+            return True
+        first_segments, names, suffixes = self._match_prefilter
+        parts = rel_path.split("/")
+        if parts[0] in first_segments:
+            return True
+        return any(part in names or part.endswith(suffixes) for part in parts)
+
     def _create_include_matcher(self, included_patterns: List[str]) -> Any:
         """Create a pathspec matcher for include override patterns.
 
@@ -224,6 +363,29 @@ class DumpSession:
         except ImportError:
             return None
 
+    def _compile_include_prefixes(
+        self, included_patterns: List[str]
+    ) -> List[Tuple[int, bool, List[Optional[Callable[[str], Any]]]]]:
+        """Precompile include patterns segment by segment for ancestor-directory checks.
+
+        Args:
+            included_patterns: List of glob patterns to force-include.
+
+        Returns:
+            One (segment count, has '**', segment matchers) tuple per pattern, where
+            a '**' segment is represented by None.
+        """
+        prefixes = []
+        for pattern in included_patterns:
+            parts = pattern.split("/")
+            matchers: List[Optional[Callable[[str], Optional[re.Match[str]]]]] = [
+                None if part == "**"
+                else re.compile(fnmatch.translate(os.path.normcase(part))).match
+                for part in parts
+            ]
+            prefixes.append((len(parts), "**" in parts, matchers))
+        return prefixes
+
     def _is_force_included(self, rel_path: str, is_dir: bool = False) -> bool:
         """Check if a path should be force-included despite matching exclusion patterns.
 
@@ -241,21 +403,20 @@ class DumpSession:
         if self.include_matcher and self.include_matcher.match_file(rel_path):
             return True
 
-        if is_dir and self.included_patterns:
-            rel_parts = rel_path.split("/")
-            for pattern in self.included_patterns:
-                pattern_parts = pattern.split("/")
-                if len(pattern_parts) <= len(rel_parts) and "**" not in pattern_parts:
+        if is_dir and self._include_prefixes:
+            rel_parts = [os.path.normcase(part) for part in rel_path.split("/")]
+            for part_count, has_globstar, matchers in self._include_prefixes:
+                if part_count <= len(rel_parts) and not has_globstar:
                     continue
                 match = True
                 for i, rel_part in enumerate(rel_parts):
-                    if i >= len(pattern_parts):
+                    if i >= part_count:
                         match = False
                         break
-                    pat_part = pattern_parts[i]
-                    if pat_part == "**":
+                    matcher = matchers[i]
+                    if matcher is None:
                         break
-                    if not fnmatch.fnmatch(rel_part, pat_part):
+                    if not matcher(rel_part):
                         match = False
                         break
                 if match:
@@ -272,7 +433,7 @@ class DumpSession:
         """
         self.skipped_files.append({"path": str(path), "reason": reason})
 
-    def is_excluded(self, item_path: Path) -> bool:
+    def is_excluded(self, item_path: Union[str, Path], is_dir: Optional[bool] = None) -> bool:
         """Check if a path should be ignored based on patterns, gitignore, and includes.
 
         Evaluates exclusion rules first (built-in excludes, ignore_patterns, gitignore,
@@ -281,20 +442,40 @@ class DumpSession:
         included.
 
         Args:
-            item_path: The path to check for exclusion.
+            item_path: The path to check for exclusion, as a Path or a plain string
+                such as DirEntry.path.
+            is_dir: Whether the path is a directory, if already known (e.g. from a
+                scandir entry). When None, the file system is queried on demand.
 
         Returns:
             True if the path matches exclusion patterns and is not force-included.
         """
-        if item_path.name == CONFIG_FILENAME:
+        path_str = os.fspath(item_path)
+        name = os.path.basename(path_str)
+        if name == CONFIG_FILENAME:
             return True
 
-        rel_path = item_path.relative_to(self.root_path).as_posix()
-
-        excluded = self.matcher.match_file(rel_path) if self.matcher else False
-
-        if excluded and self._is_force_included(rel_path, is_dir=item_path.is_dir()):
-            return False
+        if path_str.startswith(self._root_prefix):
+            rel_path = path_str[len(self._root_prefix):]
+            if os.sep != "/":
+                rel_path = rel_path.replace(os.sep, "/")
+        else:
+            rel_path = Path(path_str).relative_to(self.root_path).as_posix()
+
+        if rel_path in self._exact_excludes or (
+            is_dir and name in self._dir_prune_names
+        ):
+            excluded = True
+        elif self.matcher and self._may_match(rel_path):
+            excluded = self.matcher.match_file(rel_path)
+        else:
+            excluded = False
+
+        if excluded:
+            if is_dir is None:
+                is_dir = os.path.isdir(path_str)
+            if self._is_force_included(rel_path, is_dir=is_dir):
+                excluded = False
 
         return excluded
 
@@ -302,7 +483,8 @@ class DumpSession:
         self,
         current_path: Path,
         depth: int = 0,
-        ancestor_is_last: Optional[List[bool]] = None
+        ancestor_is_last: Optional[List[bool]] = None,
+        real_path: Optional[str] = None
     ) -> None:
         """Recursively walk the directory and build the tree representation.
         
@@ -310,6 +492,9 @@ class DumpSession:
             current_path: Current directory being processed
             depth: Current depth in the tree (0 = root)
             ancestor_is_last: List indicating if each ancestor at depth N is a last child
+            real_path: Canonical path of current_path when already known. Derived
+                from the parent for plain subdirectories, so realpath only runs for
+                the root and for symlinks.
         """
         if ancestor_is_last is None:
             ancestor_is_last = []
@@ -318,7 +503,8 @@ class DumpSession:
             return
 
         try:
-            real_path = current_path.resolve()
+            if real_path is None:
+                real_path = os.path.realpath(current_path)
             if real_path in self.visited_paths:
                 self.tree_entries.append(TreeEntry(
                     path=current_path,
@@ -350,50 +536,56 @@ class DumpSession:
         except FileNotFoundError:
             return
 
-        valid_entries = []
+        dirs = []
+        files = []
         for entry in entries:
+            entry_is_dir = entry.is_dir()
+            if self.is_excluded(entry.path, is_dir=entry_is_dir):
+                continue
             entry_path = Path(entry.path)
-            if not self.is_excluded(entry_path):
-                valid_entries.append(entry)
-
-        dirs = [e for e in valid_entries if e.is_dir()]
-        files = [e for e in valid_entries if e.is_file()] if not self.dir_only else []
+            if entry_is_dir:
+                entry_real = (
+                    None if real_path is None or entry.is_symlink()
+                    else os.path.join(real_path, entry.name)
+                )
+                dirs.append((entry_path, entry_real))
+            elif not self.dir_only and entry.is_file():
+                files.append(entry_path)
 
-        items = dirs + files
-        count = len(items)
+        count = len(dirs) + len(files)
 
-        for i, entry in enumerate(items):
+        for i, (entry_path, entry_real) in enumerate(dirs):
             is_last = (i == count - 1)
-            entry_path = Path(entry.path)
 
             entry_ancestor_is_last = ancestor_is_last.copy()
             entry_ancestor_is_last.append(is_last)
 
-            if entry.is_dir():
-                self.tree_entries.append(TreeEntry(
-                    path=entry_path,
-                    depth=depth,
-                    is_last=is_last,
-                    is_dir=True,
-                    ancestor_is_last=ancestor_is_last.copy()
-                ))
-                self.dir_count += 1
+            self.tree_entries.append(TreeEntry(
+                path=entry_path,
+                depth=depth,
+                is_last=is_last,
+                is_dir=True,
+                ancestor_is_last=ancestor_is_last.copy()
+            ))
+            self.dir_count += 1
 
-                self.generate_tree(
-                    entry_path,
-                    depth=depth + 1,
-                    ancestor_is_last=entry_ancestor_is_last
-                )
-            else:
-                self.tree_entries.append(TreeEntry(
-                    path=entry_path,
-                    depth=depth,
-                    is_last=is_last,
-                    is_dir=False,
-                    ancestor_is_last=ancestor_is_last.copy()
-                ))
-                self.file_count += 1
-                self.files_to_dump.append(entry_path)
+            self.generate_tree(
+                entry_path,
+                depth=depth + 1,
+                ancestor_is_last=entry_ancestor_is_last,
+                real_path=entry_real
+            )
+
+        for i, entry_path in enumerate(files, start=len(dirs)):
+            self.tree_entries.append(TreeEntry(
+                path=entry_path,
+                depth=depth,
+                is_last=(i == count - 1),
+                is_dir=False,
+                ancestor_is_last=ancestor_is_last.copy()
+            ))
+            self.file_count += 1
+            self.files_to_dump.append(entry_path)
 
     def filter_git_changed_files(self) -> None:
         """Filter files_to_dump to only include git-modified files."""
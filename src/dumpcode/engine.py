@@ -1,8 +1,10 @@
 """DumpEngine - Core orchestration engine for DumpCode."""
 
 import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Set, Tuple
 
 from .constants import DEFAULT_PROFILES
 from .core import DumpSession, DumpSettings
@@ -11,6 +13,12 @@ from .utils import copy_to_clipboard_osc52, setup_logger, run_shell_command
 from .writer import DumpWriter
 from .config import increment_config_version
 
+OUTPUT_BUFFER_SIZE = 1 << 20
+"""Write buffer size for the dump file, so file blocks reach disk in large chunks."""
+
+FILE_READ_WORKERS = 8
+"""Threads reading file contents ahead of the writer; reads release the GIL."""
+
 
 class DumpEngine:
     """Orchestrate the entire dumping process from file discovery to final output."""
@@ -69,7 +77,7 @@ class DumpEngine:
             if out_dir and not out_dir.exists():
                 out_dir.mkdir(parents=True)
 
-            with open(output_file, "w", encoding="utf-8") as f:
+            with open(output_file, "w", encoding="utf-8", buffering=OUTPUT_BUFFER_SIZE) as f:
                 writer = self.writer_cls(f, use_xml=self.settings.use_xml)
                 writer.version = self.config.get("version", 1)
                 
@@ -93,6 +101,26 @@ class DumpEngine:
         """
         return self.settings.active_profile
 
+    def _resolve_profile_name(self, profile: Dict[str, Any]) -> Optional[str]:
+        """Find the name under which the active profile is configured.
+
+        The profile is normally the very object stored in the config or in
+        DEFAULT_PROFILES, so an identity pass runs before the deep comparison.
+
+        Args:
+            profile: The active profile configuration dictionary.
+
+        Returns:
+            The profile name, or None for an ad-hoc profile not found in the config.
+        """
+        merged_profiles = {**DEFAULT_PROFILES, **self.config.get("profiles", {})}
+        for name, data in merged_profiles.items():
+            if data is profile:
+                return name
+        return next(
+            (name for name, data in merged_profiles.items() if data == profile), None
+        )
+
     def _exclude_output_file(self, output_file: Path, excluded: Set[str]) -> None:
         """Exclude the output file from the dump traversal to avoid self-reference.
 
@@ -179,21 +207,57 @@ class DumpEngine:
         if pre_prompt:
             writer.write_prompt(pre_prompt, tag="instructions")
     
+    def _read_ahead(
+        self, files: List[Path]
+    ) -> Iterator[Tuple[Path, Tuple[str, Optional[str]]]]:
+        """Read file contents on a thread pool while yielding them in input order.
+
+        At most twice FILE_READ_WORKERS reads are in flight, so memory stays bounded
+        by that window rather than by the size of the whole dump. Dumps of no more
+        than FILE_READ_WORKERS files are read inline, since a pool does not pay off
+        at that size.
+
+        Args:
+            files: Files to read, in the order they must be written.
+
+        Yields:
+            Each path with its (content, error_message) from get_file_content.
+        """
+        from .processors import get_file_content
+
+        if len(files) <= FILE_READ_WORKERS:
+            for file_path in files:
+                yield file_path, get_file_content(file_path, self.settings.ignore_errors)
+            return
+
+        workers = min(FILE_READ_WORKERS, len(files))
+        window = workers * 2
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            pending: Deque[Tuple[Path, Future]] = deque()
+            for file_path in files:
+                pending.append((
+                    file_path,
+                    pool.submit(get_file_content, file_path, self.settings.ignore_errors),
+                ))
+                if len(pending) >= window:
+                    done_path, future = pending.popleft()
+                    yield done_path, future.result()
+            while pending:
+                done_path, future = pending.popleft()
+                yield done_path, future.result()
+
     def _write_core_dump_block(self, writer: DumpWriter, session: DumpSession, tree_lines: List[str]) -> None:
         """Write the core dump block (tree and file contents)."""
-        from .processors import get_file_content
-        
         writer.start_dump(writer.version)
         writer.write_tree(tree_lines)
         
         writer.start_files()
         if not self.settings.structure_only:
             if session.files_to_dump:
-                for file_path in session.files_to_dump:
+                for file_path, (content, error_msg) in self._read_ahead(session.files_to_dump):
                     rel = file_path.relative_to(self.settings.start_path).as_posix()
                     if self.logger.isEnabledFor(logging.DEBUG):
                         self.logger.debug(f"Processing: {rel}")
-                    content, error_msg = get_file_content(file_path, self.settings.ignore_errors)
                     writer.write_file(rel, content)
                     if error_msg:
                         session.log_skip(file_path, error_msg)
@@ -261,10 +325,8 @@ class DumpEngine:
         self.logger.info(f"Dumped to {output_file} (Version {version})")
         self.logger.info(f"Directories: {session.dir_count}, Files: {session.file_count}")
 
-        if profile:
-            user_profiles = self.config.get("profiles", {})
-            merged_profiles = {**DEFAULT_PROFILES, **user_profiles}
-            profile_name = next(name for name, data in merged_profiles.items() if data == profile)
+        profile_name = self._resolve_profile_name(profile) if profile else None
+        if profile_name:
             self.logger.info(f"Profile '{profile_name}' prepended to output.")
 
         if self.settings.git_changed_only:
@@ -4,7 +4,7 @@ import argparse
 import json
 import sys
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, TextIO
 
 from .cli import parse_arguments_with_profiles
 from .config import interactive_init, load_or_create_config
@@ -14,25 +14,27 @@ from .utils import copy_to_clipboard_osc52, setup_logger
 from .ai.client import load_env_file
 
 
-def handle_new_plan(start_path: Path, plan_input: str) -> None:
+def handle_new_plan(start_path: Path, plan_input: str, *, stdin: Optional[TextIO] = None) -> None:
     """Write content to PLAN.md from file or stdin.
 
     Args:
         start_path: Directory where PLAN.md should be created
         plan_input: Path to plan content or '-' for stdin
+        stdin: Stream to read from in paste mode. Defaults to sys.stdin.
     """
     plan_path = start_path / "PLAN.md"
 
     try:
         if plan_input == '-':
             print("📋 [Paste Mode] Paste your Markdown content below and press Ctrl+D to save:")
-            content = sys.stdin.read()
+            content = (stdin or sys.stdin).read()
         else:
             input_path = Path(plan_input)
-            if not input_path.exists():
+            try:
+                content = input_path.read_text(encoding="utf-8")
+            except FileNotFoundError:
                 print(f"❌ File not found: {input_path}")
                 return
-            content = input_path.read_text(encoding="utf-8")
 
         plan_path.write_text(content, encoding="utf-8")
         print(f"✅ Successfully updated {plan_path}")
@@ -1,7 +1,31 @@
 """File content processing and encoding detection."""
 
+import os
 from pathlib import Path
-from typing import Callable, Dict, Optional, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
+
+BINARY_EXTENSIONS = frozenset({
+    '.pyc', '.pyo', '.so', '.dll', '.exe', '.bin', '.jpg', '.png', '.zip',
+    '.pdf', '.pyd', '.ico', '.tar', '.gz', '.7z', '.mp3', '.mp4', '.avi',
+    '.mov', '.wav', '.ogg', '.flac', '.webm', '.mkv'
+})
+"""File extensions treated as binary without inspecting their content."""
+
+# Byte-order marks mapped to their codecs; probed longest prefix first
+_BOM_TABLE = {
+    b'\xff\xfe\x00\x00': 'utf-32-le',
+    b'\x00\x00\xfe\xff': 'utf-32-be',
+    b'\xef\xbb\xbf': 'utf-8-sig',
+    b'\xff\xfe': 'utf-16-le',
+    b'\xfe\xff': 'utf-16-be',
+}
+_BOM_LENGTHS = sorted({len(bom) for bom in _BOM_TABLE}, reverse=True)
+
+BINARY_PROBE_SIZE = 1024
+"""Number of leading bytes inspected for NUL bytes when sniffing binary content."""
+
+# Raw descriptor flags for header probes; O_NONBLOCK keeps FIFOs from hanging the scan
+_HEADER_OPEN_FLAGS = os.O_RDONLY | getattr(os, "O_BINARY", 0) | getattr(os, "O_NONBLOCK", 0)
 
 
 def detect_file_encoding(header: bytes) -> str:
@@ -16,12 +40,10 @@ def detect_file_encoding(header: bytes) -> str:
     if not header:
         return 'utf-8'
 
-    if header.startswith(b'\xef\xbb\xbf'):
-        return 'utf-8-sig'
-    if header.startswith(b'\xff\xfe'):
-        return 'utf-16-le'
-    if header.startswith(b'\xfe\xff'):
-        return 'utf-16-be'
+    for length in _BOM_LENGTHS:
+        encoding = _BOM_TABLE.get(header[:length])
+        if encoding:
+            return encoding
 
     for enc in ['utf-8', 'latin-1', 'cp1252']:
         try:
@@ -33,6 +55,16 @@ def detect_file_encoding(header: bytes) -> str:
     return 'utf-8'
 
 
+def _has_binary_extension(filepath: Path) -> bool:
+    """Check whether a file's extension marks it as binary without reading it."""
+    return filepath.suffix.lower() in BINARY_EXTENSIONS
+
+
+def _looks_binary(head: bytes) -> bool:
+    """Check whether the leading bytes of a file contain a NUL byte."""
+    return b'\0' in head[:BINARY_PROBE_SIZE]
+
+
 def is_binary_file(filepath: Path) -> bool:
     """Check if a file is likely binary based on extension and content.
     
@@ -42,12 +74,7 @@ def is_binary_file(filepath: Path) -> bool:
     Returns:
         True if the file is detected as binary, False otherwise.
     """
-    binary_extensions = {
-        '.pyc', '.pyo', '.so', '.dll', '.exe', '.bin', '.jpg', '.png', '.zip',
-        '.pdf', '.pyd', '.ico', '.tar', '.gz', '.7z', '.mp3', '.mp4', '.avi',
-        '.mov', '.wav', '.ogg', '.flac', '.webm', '.mkv'
-    }
-    if filepath.suffix.lower() in binary_extensions:
+    if _has_binary_extension(filepath):
         return True
 
     try:
@@ -56,7 +83,7 @@ def is_binary_file(filepath: Path) -> bool:
         if filepath.stat().st_size == 0:
             return False
         with open(filepath, 'rb') as f:
-            if b'\0' in f.read(1024):
+            if _looks_binary(f.read(BINARY_PROBE_SIZE)):
                 return True
     except Exception:
         return True
@@ -122,12 +149,25 @@ def get_file_content(file_path: Path, ignore_errors: bool = False) -> Tuple[str,
     if ext in CONTENT_PROCESSORS:
         return CONTENT_PROCESSORS[ext](file_path), None
     
-    if is_binary_file(file_path):
+    if _has_binary_extension(file_path):
         return "[Binary file content omitted]\n", None
     
     try:
-        with open(file_path, 'rb') as f:
-            raw_data = f.read()
+        # One raw descriptor serves both the binary probe and the full read
+        try:
+            fd = os.open(file_path, _HEADER_OPEN_FLAGS)
+        except OSError as e:
+            # Like is_binary_file: an existing file that cannot be opened counts as binary
+            if not isinstance(e, FileNotFoundError):
+                return "[Binary file content omitted]\n", None
+            raise
+        try:
+            head = os.read(fd, BINARY_PROBE_SIZE)
+            if _looks_binary(head):
+                return "[Binary file content omitted]\n", None
+            raw_data = _read_all(fd, head)
+        finally:
+            os.close(fd)
         
         header = raw_data[:4096]
         encoding = detect_file_encoding(header)
@@ -136,4 +176,23 @@ def get_file_content(file_path: Path, ignore_errors: bool = False) -> Tuple[str,
         return raw_data.decode(encoding, errors=error_handler), None
     except Exception as e:
         error_msg = f"Error reading file: {e}"
-        return f"[{error_msg}]", error_msg
\ No newline at end of file
+        return f"[{error_msg}]", error_msg
+
+
+def _read_all(fd: int, head: bytes = b"") -> bytes:
+    """Read a file descriptor to EOF, sized by fstat to avoid buffer regrowth.
+
+    Args:
+        fd: Open file descriptor.
+        head: Bytes already read from the start of the file.
+
+    Returns:
+        The complete file content, starting with head.
+    """
+    chunks: List[bytes] = [head]
+    chunk_size = max(os.fstat(fd).st_size - len(head), 1024) + 1
+    while True:
+        chunk = os.read(fd, chunk_size)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
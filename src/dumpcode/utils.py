@@ -6,7 +6,37 @@ import subprocess
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, List, Optional, Tuple
+
+
+_TOKENIZER_UNAVAILABLE = object()
+"""Marker stored in _TOKENIZER once loading the encoding has failed."""
+
+_TOKENIZER: Optional[Any] = None
+"""Cached cl100k_base encoding, or _TOKENIZER_UNAVAILABLE after a failed load."""
+
+
+def _get_tokenizer() -> Optional[Any]:
+    """Return the tiktoken cl100k_base encoding, loading it on first use.
+
+    Returns:
+        The encoding, or None if tiktoken is unavailable or failed to load.
+    """
+    global _TOKENIZER
+    if _TOKENIZER is None:
+        try:
+            import tiktoken
+            _TOKENIZER = tiktoken.get_encoding("cl100k_base")
+        except Exception: # Catch ALL errors here to ensure fallback
+            _TOKENIZER = _TOKENIZER_UNAVAILABLE
+    return None if _TOKENIZER is _TOKENIZER_UNAVAILABLE else _TOKENIZER
+
+
+def _estimate_tokens_by_chars(text: str, logger: Optional[logging.Logger]) -> int:
+    """Character-based token estimate used when tiktoken cannot encode the text."""
+    if logger:
+        logger.debug("tiktoken failed; using character-based estimation")
+    return len(text) // 4
 
 
 def estimate_tokens(text: str, logger: Optional[logging.Logger] = None) -> int:
@@ -22,14 +52,13 @@ def estimate_tokens(text: str, logger: Optional[logging.Logger] = None) -> int:
     Returns:
         Estimated token count.
     """
+    encoding = _get_tokenizer()
+    if encoding is None:
+        return _estimate_tokens_by_chars(text, logger)
     try:
-        import tiktoken
-        encoding = tiktoken.get_encoding("cl100k_base")
         return len(encoding.encode(text))
     except Exception: # Catch ALL errors here to ensure fallback
-        if logger:
-            logger.debug("tiktoken failed; using character-based estimation")
-        return len(text) // 4
+        return _estimate_tokens_by_chars(text, logger)
 
 
 def get_git_modified_files(root_path: Path) -> List[Path]:
@@ -90,16 +90,22 @@ class DumpWriter:
     def write_file(self, rel_path: str, content: str) -> None:
         """Write a single file's path and content wrapped in file tags.
 
+        The content is streamed between the opening and closing tags rather than
+        interpolated into one string, so large files are not copied again.
+
         Args:
             rel_path: Relative path of the file.
             content: String content of the file.
         """
         if self.use_xml:
             escaped_path = escape(rel_path, entities={'"': "&quot;"})
-            escaped_content = escape(content)
-            self.write_raw(f'    <file path="{escaped_path}">\n{escaped_content}\n    </file>\n')
+            self.write_raw(f'    <file path="{escaped_path}">\n')
+            self.write_raw(escape(content))
+            self.write_raw("\n    </file>\n")
         else:
-            self.write_raw(f"--- FILE: {rel_path} ---\n{content}\n\n")
+            self.write_raw(f"--- FILE: {rel_path} ---\n")
+            self.write_raw(content)
+            self.write_raw("\n\n")
 
     def end_files(self) -> None:
         """Write the closing files container tag."""
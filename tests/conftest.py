@@ -2,14 +2,22 @@
 
 from fixtures.fs_fixtures import (  # noqa: F401
     deep_project,
+    default_config_bytes,
     default_settings,
+    make_tree,
     project_env,
     settings_factory,
     tree_entry_factory,
 )
 from fixtures.git_fixtures import git_repo  # noqa: F401
-from fixtures.mock_fixtures import ui_simulation  # noqa: F401
+from fixtures.mock_fixtures import (  # noqa: F401
+    fake_input,
+    make_stream_chunk,
+    raiser,
+    ui_simulation,
+)
 from fixtures.output_checker import (  # noqa: F401
+    assert_contains_all,
     assert_sandwich_structure,
     validate_xml_improved,
 )
@@ -1,14 +1,49 @@
 """File system fixtures for DumpCode tests."""
 
 import json
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Union
+from unittest.mock import patch
 
 import pytest
 
+from dumpcode.config import interactive_init
+from dumpcode.constants import CONFIG_FILENAME
 from dumpcode.core import DumpSettings, TreeEntry
 
 
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+
+def _make_tree(root: Path, spec: Dict[str, Union[str, bytes]]) -> Path:
+    """Create files (and empty directories for keys ending in '/') under root.
+
+    Each distinct parent directory is created once, and files are written
+    through raw descriptors.
+    """
+    parents = {os.path.dirname(rel) for rel in spec}
+    for parent in sorted(parents):
+        if parent:
+            os.makedirs(root / parent, exist_ok=True)
+
+    for rel, data in spec.items():
+        if rel.endswith("/"):
+            continue
+        fd = os.open(root / rel, _WRITE_FLAGS, 0o644)
+        try:
+            os.write(fd, data.encode() if isinstance(data, str) else data)
+        finally:
+            os.close(fd)
+    return root
+
+
+@pytest.fixture(scope="session")
+def make_tree():
+    """Provide the tree builder: make_tree(root, {"src/a.py": "...", "empty/": ""})."""
+    return _make_tree
+
+
 @pytest.fixture
 def project_env(tmp_path):
     """Generate a tmp_path with a standard project structure.
@@ -18,18 +53,6 @@ def project_env(tmp_path):
     - .gitignore
     - .dump_config.json (valid config)
     """
-    # Create standard project structure
-    src_dir = tmp_path / "src"
-    src_dir.mkdir()
-    
-    # Create main.py with some content
-    main_py = src_dir / "main.py"
-    main_py.write_text('print("Hello, World!")\n')
-    
-    # Create .gitignore
-    gitignore = tmp_path / ".gitignore"
-    gitignore.write_text("*.pyc\n__pycache__/\n")
-    
     # Create valid .dump_config.json
     config = {
         "version": 1,
@@ -43,10 +66,11 @@ def project_env(tmp_path):
             }
         }
     }
-    config_file = tmp_path / ".dump_config.json"
-    config_file.write_text(json.dumps(config, indent=2))
-    
-    return tmp_path
+    return _make_tree(tmp_path, {
+        "src/main.py": 'print("Hello, World!")\n',
+        ".gitignore": "*.pyc\n__pycache__/\n",
+        ".dump_config.json": json.dumps(config, indent=2),
+    })
 
 
 @pytest.fixture
@@ -85,28 +109,13 @@ def deep_project(tmp_path):
       binary.dat (binary file)
       ignored.pyc (file that would be ignored by .gitignore patterns)
     """
-    # Create nested directory structure
-    dir1 = tmp_path / "dir1"
-    dir1.mkdir()
-    dir2 = dir1 / "dir2"
-    dir2.mkdir()
-    dir3 = dir2 / "dir3"
-    dir3.mkdir()
-    
-    # Create text files at each level
-    (dir1 / "file1.txt").write_text("Content of file1")
-    (dir2 / "file2.txt").write_text("Content of file2")
-    (dir3 / "file3.txt").write_text("Content of file3")
-    
-    # Create binary file
-    binary_file = tmp_path / "binary.dat"
-    binary_file.write_bytes(b"\x00\x01\x02\x03\x04\x05")
-    
-    # Create file that would typically be ignored
-    ignored_file = tmp_path / "ignored.pyc"
-    ignored_file.write_text("Compiled Python bytecode")
-    
-    return tmp_path
+    return _make_tree(tmp_path, {
+        "dir1/file1.txt": "Content of file1",
+        "dir1/dir2/file2.txt": "Content of file2",
+        "dir1/dir2/dir3/file3.txt": "Content of file3",
+        "binary.dat": b"\x00\x01\x02\x03\x04\x05",
+        "ignored.pyc": "Compiled Python bytecode",
+    })
 
 
 @pytest.fixture
@@ -205,4 +214,16 @@ def settings_factory(tmp_path):
             reset_version=reset_version,
             verbose=verbose
         )
-    return make_dump_settings
\ No newline at end of file
+    return make_dump_settings
+
+
+@pytest.fixture(scope="session")
+def default_config_bytes(tmp_path_factory):
+    """Raw bytes of the config `--init` writes when every prompt is left blank.
+
+    Generated once per session; write it to a directory to seed an existing config.
+    """
+    init_dir = tmp_path_factory.mktemp("init_config")
+    with patch("builtins.input", side_effect=["", ""]):
+        interactive_init(init_dir)
+    return (init_dir / CONFIG_FILENAME).read_bytes()
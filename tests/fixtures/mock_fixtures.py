@@ -1,6 +1,7 @@
 """Mock fixtures for DumpCode tests."""
 
 import sys
+from types import SimpleNamespace
 from unittest.mock import Mock
 
 import pytest
@@ -25,4 +26,41 @@ def ui_simulation(monkeypatch):
     return {
         "stdout": mock_stdout,
         "set_tty": set_tty
-    }
\ No newline at end of file
+    }
+
+@pytest.fixture(scope="session")
+def make_stream_chunk():
+    """Factory for OpenAI-style streaming chunks built from plain namespaces.
+
+    Args:
+        text: Delta content carried by the chunk (None for usage-only chunks)
+        usage: Optional usage object attached to the chunk (default: None)
+
+    Returns:
+        A function that creates chunk objects with the given parameters
+    """
+    def _make_chunk(text, usage=None):
+        return SimpleNamespace(
+            choices=[SimpleNamespace(delta=SimpleNamespace(content=text))],
+            usage=usage
+        )
+    return _make_chunk
+
+
+@pytest.fixture
+def fake_input(monkeypatch):
+    """Return a function that scripts the answers given to input()."""
+    def _use(answers):
+        it = iter(answers)
+        monkeypatch.setattr("builtins.input", lambda *args, **kwargs: next(it))
+    return _use
+
+
+@pytest.fixture(scope="session")
+def raiser():
+    """Return a factory for stand-ins that raise the given exception whenever called."""
+    def _raiser(exc):
+        def _raise(*args, **kwargs):
+            raise exc
+        return _raise
+    return _raiser
@@ -3,7 +3,7 @@
 import re
 import xml.etree.ElementTree as ET
 from xml.parsers.expat import ExpatError
-from typing import List
+from typing import Iterable, List
 
 import pytest
 
@@ -96,6 +96,24 @@ class OutputChecker:
                 f"Content preview: {content[:500]}..."
             )
     
+    @classmethod
+    def check_fragments(
+        cls, data: bytes, present: Iterable[bytes], absent: Iterable[bytes] = ()
+    ) -> None:
+        """Check raw output bytes for required and forbidden fragments in one pass.
+
+        Args:
+            data: The undecoded output, e.g. from Path.read_bytes()
+            present: Fragments that must occur
+            absent: Fragments that must not occur
+
+        Raises:
+            AssertionError: Listing every missing and unexpected fragment
+        """
+        missing = [needle for needle in present if needle not in data]
+        unexpected = [needle for needle in absent if needle in data]
+        assert not (missing or unexpected), f"missing={missing} unexpected={unexpected}"
+
     @classmethod
     def _extract_xml_sections(cls, content: str) -> List[str]:
         """Extract XML sections from content.
@@ -137,7 +155,7 @@ class OutputChecker:
         return sections
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def assert_sandwich_structure():
     """Fixture that returns a function to validate sandwich structure."""
     def _validate(content: str) -> None:
@@ -145,7 +163,13 @@ def assert_sandwich_structure():
     return _validate
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def assert_contains_all():
+    """Fixture that returns a function checking output bytes for fragments."""
+    return OutputChecker.check_fragments
+
+
+@pytest.fixture(scope="session")
 def validate_xml_improved():
     """Improved XML validation fixture using proper XML parsing."""
     def _validate(content: str) -> None:
@@ -5,7 +5,7 @@ import pytest
 from .output_checker import OutputChecker
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def validate_xml():
     """Fixture to validate XML content using improved XML parsing.
     
@@ -14,7 +14,8 @@ def validate_xml():
     - <dump>...</dump>
     - <task>...</task>
     
-    This validator uses proper XML parsing instead of regex.
+    This validator uses proper XML parsing instead of regex. It holds no
+    state, so one instance is shared by the whole session.
     
     Returns:
         A function that validates XML content
@@ -1,5 +1,6 @@
 """Unit tests for AI orchestrator lifecycle."""
 
+from types import SimpleNamespace
 from unittest.mock import Mock, patch
 from pathlib import Path
 
@@ -7,16 +8,29 @@ from dumpcode.ai.base import AIResponse, StreamChunk
 from dumpcode.ai.orchestrator import AIOrchestrator
 
 
+def _only_info(logger: Mock) -> str:
+    """Assert a single info log and return its message."""
+    logger.info.assert_called_once()
+    return logger.info.call_args.args[0]
+
+
+def _only_error(logger: Mock) -> str:
+    """Assert a single error log and return its message."""
+    logger.error.assert_called_once()
+    return logger.error.call_args.args[0]
+
+
 class TestAIOrchestrator:
     """Test the AI orchestrator lifecycle."""
     
     def test_orchestrator_respects_callback(self):
         """Test Case 1: Verify orchestrator uses custom callback instead of sys.stdout."""
         # Setup
-        mock_settings = Mock()
-        mock_settings.model_override = "test-model"
-        mock_settings.active_profile = None
-        mock_settings.start_path = Path("/test/path")
+        mock_settings = SimpleNamespace(
+            model_override="test-model",
+            active_profile=None,
+            start_path=Path("/test/path"),
+        )
         
         mock_logger = Mock()
         orchestrator = AIOrchestrator(mock_settings, mock_logger)
@@ -57,18 +71,17 @@ class TestAIOrchestrator:
         assert "Hello World" not in all_writes  # Chunks went to callback instead
         
         # Verify logging of token usage
-        mock_logger.info.assert_called_once()
-        info_msg = mock_logger.info.call_args[0][0]
-        assert "Input: 10" in info_msg
-        assert "Output: 5" in info_msg
+        msg = _only_info(mock_logger)
+        assert "Input: 10" in msg and "Output: 5" in msg
     
     def test_orchestrator_logs_usage(self):
         """Test Case 2: Verify orchestrator logs token usage when available."""
         # Setup
-        mock_settings = Mock()
-        mock_settings.model_override = "test-model"
-        mock_settings.active_profile = None
-        mock_settings.start_path = Path("/test/path")
+        mock_settings = SimpleNamespace(
+            model_override="test-model",
+            active_profile=None,
+            start_path=Path("/test/path"),
+        )
         
         mock_logger = Mock()
         orchestrator = AIOrchestrator(mock_settings, mock_logger)
@@ -98,18 +111,17 @@ class TestAIOrchestrator:
         assert result == mock_response
         
         # Verify logging of token usage
-        mock_logger.info.assert_called_once()
-        info_msg = mock_logger.info.call_args[0][0]
-        assert "Input: 100" in info_msg
-        assert "Output: 50" in info_msg
+        msg = _only_info(mock_logger)
+        assert "Input: 100" in msg and "Output: 50" in msg
     
     def test_orchestrator_fallback_to_stdout(self):
         """Test that orchestrator falls back to sys.stdout when no callback provided."""
         # Setup
-        mock_settings = Mock()
-        mock_settings.model_override = "test-model"
-        mock_settings.active_profile = None
-        mock_settings.start_path = Path("/test/path")
+        mock_settings = SimpleNamespace(
+            model_override="test-model",
+            active_profile=None,
+            start_path=Path("/test/path"),
+        )
         
         mock_logger = Mock()
         orchestrator = AIOrchestrator(mock_settings, mock_logger)
@@ -151,9 +163,10 @@ class TestAIOrchestrator:
     def test_orchestrator_handles_read_error(self):
         """Test that orchestrator handles dump file read errors gracefully."""
         # Setup
-        mock_settings = Mock()
-        mock_settings.model_override = "test-model"
-        mock_settings.active_profile = None
+        mock_settings = SimpleNamespace(
+            model_override="test-model",
+            active_profile=None,
+        )
         
         mock_logger = Mock()
         orchestrator = AIOrchestrator(mock_settings, mock_logger)
@@ -167,16 +180,15 @@ class TestAIOrchestrator:
         
         # Assertions
         assert result is None
-        mock_logger.error.assert_called_once()
-        error_msg = mock_logger.error.call_args[0][0]
-        assert "Could not read dump file" in error_msg
+        assert "Could not read dump file" in _only_error(mock_logger)
     
     def test_orchestrator_no_model_error(self):
         """Test that orchestrator returns None when no model is configured."""
         # Setup
-        mock_settings = Mock()
-        mock_settings.model_override = None  # No model override
-        mock_settings.active_profile = None  # No active profile
+        mock_settings = SimpleNamespace(
+            model_override=None,
+            active_profile=None,
+        )
         
         mock_logger = Mock()
         orchestrator = AIOrchestrator(mock_settings, mock_logger)
@@ -191,17 +203,16 @@ class TestAIOrchestrator:
         
         # Assertions
         assert result is None
-        mock_logger.error.assert_called_once()
-        error_msg = mock_logger.error.call_args[0][0]
-        assert "Auto-mode enabled but no model found in profile" in error_msg
+        assert "Auto-mode enabled but no model found in profile" in _only_error(mock_logger)
     
     def test_orchestrator_uses_profile_model(self):
         """Test that orchestrator uses model from active profile when no override."""
         # Setup
-        mock_settings = Mock()
-        mock_settings.model_override = None  # No override
-        mock_settings.active_profile = {"model": "profile-model"}  # Profile has model
-        mock_settings.start_path = Path("/test/path")
+        mock_settings = SimpleNamespace(
+            model_override=None,
+            active_profile={"model": "profile-model"},
+            start_path=Path("/test/path"),
+        )
         
         mock_logger = Mock()
         orchestrator = AIOrchestrator(mock_settings, mock_logger)
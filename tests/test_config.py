@@ -1,12 +1,15 @@
 """Unit tests for configuration loading."""
 
 import json
+import os
+import shutil
 import sys
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch
+from unittest.mock import Mock
 
 from dumpcode.config import (
+    DEFAULT_CONFIG,
     load_or_create_config,
     interactive_init,
     increment_config_version,
@@ -16,137 +19,166 @@ from dumpcode.config import (
 from dumpcode.constants import CONFIG_FILENAME, DEFAULT_PROFILES, DEFAULT_MODEL
 
 
+_HOME = Path.home()
+_ROOT = Path("/")
+_ETC = Path("/etc")
+_TMP = Path("/tmp")
+
+
+SEED_CONFIG = {
+    "version": 5,
+    "ignore_patterns": ["*.pyc", "node_modules"],
+    "profiles": {"custom": {"description": "Test"}}
+}
+SEED_CONFIG_BYTES = json.dumps(SEED_CONFIG).encode()
+
+LEGACY_CONFIG_BYTES = json.dumps({
+    "version": 1,
+    "profiles": {
+        "legacy_prof": {
+            "description": "Legacy profile",
+            "auto": True,
+            "model": "gpt-4"
+        }
+    }
+}).encode()
+
+MIXED_CONFIG_BYTES = json.dumps({
+    "version": 1,
+    "profiles": {
+        "mixed_prof": {
+            "description": "Profile with both keys",
+            "auto": True,
+            "auto_send": False  # Explicit auto_send should be preserved
+        }
+    }
+}).encode()
+
+
+@pytest.fixture(scope="session")
+def baseline_config_dir(tmp_path_factory):
+    """Write the shared seed config once per session."""
+    baseline = tmp_path_factory.mktemp("baseline_config")
+    (baseline / CONFIG_FILENAME).write_bytes(SEED_CONFIG_BYTES)
+    return baseline
+
+
+@pytest.fixture
+def config_dir(baseline_config_dir, tmp_path_factory):
+    """Provide a private copy of the baseline config directory."""
+    target = tmp_path_factory.mktemp("cfg")
+    shutil.copytree(baseline_config_dir, target, dirs_exist_ok=True)
+    return target
+
+
+@pytest.fixture(scope="session")
+def default_config_dir(tmp_path_factory):
+    """Directory in which a default config has been created once per session."""
+    defaults = tmp_path_factory.mktemp("defaults")
+    load_or_create_config(defaults, reset_version=False)
+    return defaults
+
+
+@pytest.fixture(scope="session")
+def default_config(default_config_dir):
+    """The default config as returned on first creation. Treat as read-only."""
+    return json.loads((default_config_dir / CONFIG_FILENAME).read_bytes())
+
+
 class TestConfigLoading:
     """Test the load_or_create_config function."""
     
-    def test_create_new_config(self, tmp_path):
+    def test_create_new_config(self, default_config):
         """Test creating a new config when none exists."""
-        config = load_or_create_config(tmp_path, reset_version=False)
-
-        assert "version" in config
-        assert "ignore_patterns" in config
-        assert "profiles" in config
-        assert config["version"] == 1
-        
-        config_path = tmp_path / CONFIG_FILENAME
-        assert config_path.exists()
-        
-        with open(config_path, "r") as f:
-            saved_config = json.load(f)
-        assert saved_config["version"] == 1
+        assert "version" in default_config
+        assert "ignore_patterns" in default_config
+        assert "profiles" in default_config
+        assert default_config["version"] == 1
     
-    def test_load_existing_config(self, tmp_path):
+    def test_load_existing_config(self, config_dir):
         """Test loading an existing config file."""
-        config_path = tmp_path / CONFIG_FILENAME
-        test_config = {
-            "version": 5,
-            "ignore_patterns": ["*.pyc", "node_modules"],
-            "profiles": {"custom": {"description": "Test"}}
-        }
-        with open(config_path, "w") as f:
-            json.dump(test_config, f)
+        config_path = config_dir / CONFIG_FILENAME
         
-        config = load_or_create_config(tmp_path, reset_version=False)
+        config = load_or_create_config(config_dir, reset_version=False)
         
         assert config["version"] == 5
         assert config["ignore_patterns"] == ["*.pyc", "node_modules"]
         assert "custom" in config["profiles"]
         
-        with open(config_path, "r") as f:
-            saved_config = json.load(f)
+        saved_config = json.loads(config_path.read_bytes())
         assert saved_config["version"] == 5
     
-    def test_reset_version(self, tmp_path):
+    def test_reset_version(self, config_dir):
         """Test resetting version to 1."""
-        config_path = tmp_path / CONFIG_FILENAME
-        test_config = {"version": 5, "ignore_patterns": [], "profiles": {"test": {"description": "Test"}}}
-        with open(config_path, "w") as f:
-            json.dump(test_config, f)
+        config_path = config_dir / CONFIG_FILENAME
         
-        config = load_or_create_config(tmp_path, reset_version=True)
+        config = load_or_create_config(config_dir, reset_version=True)
         
         assert config["version"] == 1
         
-        with open(config_path, "r") as f:
-            saved_config = json.load(f)
+        saved_config = json.loads(config_path.read_bytes())
         assert saved_config["version"] == 1
     
-    def test_corrupted_config(self, tmp_path):
-        """Test handling of corrupted config file."""
+    @pytest.mark.parametrize(
+        "seed_content,check",
+        [
+            ("{ invalid json", lambda c: "profiles" in c and "ignore_patterns" in c),
+            (
+                json.dumps({"version": 1, "ignore_patterns": []}),
+                lambda c: c["profiles"] == DEFAULT_PROFILES,
+            ),
+            (
+                json.dumps({"version": 3, "profiles": {"test": {"description": "Test profile"}}}),
+                lambda c: c["version"] == 3 and "ignore_patterns" in c
+                and "test" in c["profiles"] and "readme" in c["profiles"],
+            ),
+        ],
+        ids=["corrupted", "missing_profiles", "merge_with_defaults"],
+    )
+    def test_recovery_paths(self, tmp_path, seed_content, check):
+        """Test that corrupted or partial configs are completed from defaults."""
         config_path = tmp_path / CONFIG_FILENAME
-        with open(config_path, "w") as f:
-            f.write("{ invalid json")
+        config_path.write_text(seed_content)
         
         config = load_or_create_config(tmp_path, reset_version=False)
         
         assert "version" in config
-        assert "ignore_patterns" in config
-        assert "profiles" in config
+        assert check(config)
         
-        with open(config_path, "r") as f:
-            saved_config = json.load(f)
+        saved_config = json.loads(config_path.read_bytes())
         assert "version" in saved_config
-    
-    def test_missing_profiles(self, tmp_path):
-        """Test config missing profiles key."""
-        config_path = tmp_path / CONFIG_FILENAME
-        test_config = {"version": 1, "ignore_patterns": []}
-        with open(config_path, "w") as f:
-            json.dump(test_config, f)
-        
-        config = load_or_create_config(tmp_path, reset_version=False)
-        
-        assert "profiles" in config
-        assert config["profiles"] == DEFAULT_PROFILES
-    
-    def test_merge_with_defaults(self, tmp_path):
-        """Test that loaded config merges with defaults."""
-        config_path = tmp_path / CONFIG_FILENAME
-        test_config = {
-            "version": 3,
-            "profiles": {"test": {"description": "Test profile"}}
-        }
-        with open(config_path, "w") as f:
-            json.dump(test_config, f)
-        
-        config = load_or_create_config(tmp_path, reset_version=False)
-        
-        assert config["version"] == 3
-        assert "ignore_patterns" in config
-        assert "profiles" in config
-        assert "test" in config["profiles"]
-        assert "readme" in config["profiles"]
 
+    def test_modified_config_is_reloaded(self, config_dir):
+        """Editing the config file between loads is picked up."""
+        load_or_create_config(config_dir)
+        config_path = config_dir / CONFIG_FILENAME
+        config_path.write_text(json.dumps({**SEED_CONFIG, "version": 42, "use_xml": False}))
 
-def test_interactive_init_creates_ai_fields(tmp_path):
-    """Verify that init generates a config with auto_send=False and Sonnet."""
-    # Mock inputs for standard questions
-    with patch('builtins.input', side_effect=['', 'y']):
-        interactive_init(tmp_path)
+        config = load_or_create_config(config_dir)
 
-    config_path = tmp_path / CONFIG_FILENAME
-    with open(config_path, "r") as f:
-        data = json.load(f)
+        assert config["version"] == 42
+        assert config["use_xml"] is False
+
+
+def test_default_profiles_read_only(tmp_path):
+    """Built-in profiles cannot be mutated through a loaded config."""
+    with pytest.raises(TypeError):
+        DEFAULT_PROFILES["rogue"] = {"description": "x"}
+
+    config = load_or_create_config(tmp_path)
+    config["profiles"]["rogue"] = {"description": "x"}
+
+    assert "rogue" not in DEFAULT_PROFILES
 
-    # Check a representative profile (e.g., readme)
-    readme_profile = data["profiles"]["readme"]
-    assert readme_profile["auto_send"] is False
-    assert readme_profile["model"] == DEFAULT_MODEL
+
+def test_default_config_is_json_serializable():
+    """The default config holds plain dicts even though DEFAULT_PROFILES is read-only."""
+    assert json.loads(json.dumps(DEFAULT_CONFIG))["profiles"].keys() == DEFAULT_PROFILES.keys()
 
 
 def test_config_migration_on_load(tmp_path):
     """Verify that old 'auto' keys are converted to 'auto_send' upon loading."""
-    legacy_config = {
-        "version": 1,
-        "profiles": {
-            "legacy_prof": {
-                "description": "Legacy profile",
-                "auto": True,
-                "model": "gpt-4"
-            }
-        }
-    }
-    (tmp_path / CONFIG_FILENAME).write_text(json.dumps(legacy_config))
+    (tmp_path / CONFIG_FILENAME).write_bytes(LEGACY_CONFIG_BYTES)
 
     # Loading the config should trigger migration
     config = load_or_create_config(tmp_path)
@@ -159,17 +191,7 @@ def test_config_migration_on_load(tmp_path):
 
 def test_config_migration_preserves_auto_send(tmp_path):
     """Verify that migration doesn't overwrite existing auto_send."""
-    config_with_both = {
-        "version": 1,
-        "profiles": {
-            "mixed_prof": {
-                "description": "Profile with both keys",
-                "auto": True,
-                "auto_send": False  # Explicit auto_send should be preserved
-            }
-        }
-    }
-    (tmp_path / CONFIG_FILENAME).write_text(json.dumps(config_with_both))
+    (tmp_path / CONFIG_FILENAME).write_bytes(MIXED_CONFIG_BYTES)
 
     config = load_or_create_config(tmp_path)
 
@@ -180,203 +202,174 @@ def test_config_migration_preserves_auto_send(tmp_path):
     assert "auto" in profile
 
 
-def test_interactive_init_flow(tmp_path, capsys):
-    """Test interactive_init with user input simulation."""
-    # Create existing config to trigger overwrite prompt
-    config_path = tmp_path / CONFIG_FILENAME
-    with open(config_path, "w") as f:
-        json.dump({"version": 1, "ignore_patterns": [], "profiles": {}}, f)
-    
-    # Simulate user inputs: 'y' to overwrite, 'node_modules,temp' for extra ignores, 'y' for XML
-    with patch('builtins.input', side_effect=['y', 'node_modules,temp', 'y']):
-        interactive_init(tmp_path)
-    
-    config_path = tmp_path / CONFIG_FILENAME
-    assert config_path.exists()
-    
-    with open(config_path, "r") as f:
-        config = json.load(f)
-    
-    # Check basic structure
-    assert config["version"] == 1
-    assert "ignore_patterns" in config
-    assert "profiles" in config
-    assert "use_xml" in config
-    
-    # Check that extra ignores were added
-    assert "node_modules" in config["ignore_patterns"]
-    assert "temp" in config["ignore_patterns"]
-    
-    # Check default ignores are still there
-    assert ".git" in config["ignore_patterns"]
-    assert "__pycache__" in config["ignore_patterns"]
-    
-    # Check XML preference
-    assert config["use_xml"] is True
-    
-    # Check output contains success message
-    captured = capsys.readouterr()
-    assert "✅ Created" in captured.out
-
-
-def test_interactive_init_no_overwrite(tmp_path, capsys):
-    """Test interactive_init when user chooses not to overwrite existing config."""
-    # Create an existing config file
+EXISTING_CONFIG = {"version": 1, "ignore_patterns": ["existing"], "profiles": {}, "use_xml": False}
+
+
+def _has_ignores(*names):
+    """Predicate: every name is among the ignore patterns."""
+    return lambda patterns: all(name in patterns for name in names)
+
+
+@pytest.mark.parametrize(
+    "seed,inputs,created,expected",
+    [
+        pytest.param(
+            None, ['', 'y'], True,
+            {"profiles": lambda p: p["readme"]["auto_send"] is False
+             and p["readme"]["model"] == DEFAULT_MODEL},
+            id="creates_ai_fields",
+        ),
+        pytest.param(
+            "default", ['y', 'node_modules,temp', 'y'], True,
+            {
+                "version": lambda v: v == 1,
+                "profiles": lambda p: isinstance(p, dict),
+                "ignore_patterns": _has_ignores("node_modules", "temp", ".git", "__pycache__"),
+                "use_xml": lambda x: x is True,
+            },
+            id="flow",
+        ),
+        pytest.param(
+            EXISTING_CONFIG, ['n'], False,
+            {"ignore_patterns": lambda p: p == ["existing"], "use_xml": lambda x: x is False},
+            id="no_overwrite",
+        ),
+        pytest.param(
+            "default", ['y', '', 'n'], True,
+            {"ignore_patterns": _has_ignores(".git", "__pycache__"), "use_xml": lambda x: x is False},
+            id="no_extra_ignores_xml_no",
+        ),
+        pytest.param(
+            "default", ['y', '', 'N'], True,
+            {"use_xml": lambda x: x is False},
+            id="xml_no_upper",
+        ),
+        pytest.param(
+            "default", ['y', '', 'y'], True,
+            {"use_xml": lambda x: x is True},
+            id="xml_yes",
+        ),
+        pytest.param(
+            None, ['', ''], True,
+            {"use_xml": lambda x: x is True},  # Empty input should default to True
+            id="empty_xml_input",
+        ),
+    ],
+)
+def test_interactive_init(
+    tmp_path, capsys, fake_input, default_config_bytes, seed, inputs, created, expected
+):
+    """Test interactive_init prompts against fresh and existing configs."""
     config_path = tmp_path / CONFIG_FILENAME
-    existing_config = {"version": 1, "ignore_patterns": ["existing"], "profiles": {}, "use_xml": False}
-    with open(config_path, "w") as f:
-        json.dump(existing_config, f)
+    if seed == "default":
+        # Existing config triggers the overwrite prompt
+        config_path.write_bytes(default_config_bytes)
+    elif seed is not None:
+        config_path.write_text(json.dumps(seed))
     
-    # Simulate user input: 'n' to not overwrite
-    with patch('builtins.input', return_value='n'):
-        interactive_init(tmp_path)
+    fake_input(inputs)
+    interactive_init(tmp_path)
     
-    # Config should remain unchanged
-    with open(config_path, "r") as f:
-        config = json.load(f)
+    config = json.loads(config_path.read_bytes())
     
-    assert config["ignore_patterns"] == ["existing"]
-    assert config["use_xml"] is False
+    for key, check in expected.items():
+        assert check(config[key]), key
     
-    # Check output doesn't contain success message
     captured = capsys.readouterr()
-    assert "✅ Created" not in captured.out
-
-
-def test_interactive_init_no_extra_ignores(tmp_path, capsys):
-    """Test interactive_init with empty extra ignores input."""
-    # Create existing config to trigger overwrite prompt
-    config_path = tmp_path / CONFIG_FILENAME
-    with open(config_path, "w") as f:
-        json.dump({"version": 1, "ignore_patterns": [], "profiles": {}}, f)
-    
-    with patch('builtins.input', side_effect=['y', '', 'n']):
-        interactive_init(tmp_path)
-    
-    config_path = tmp_path / CONFIG_FILENAME
-    with open(config_path, "r") as f:
-        config = json.load(f)
-    
-    # Should have default ignores only
-    assert ".git" in config["ignore_patterns"]
-    assert "__pycache__" in config["ignore_patterns"]
-    assert config["use_xml"] is False  # 'n' for XML
-
-
-def test_interactive_init_no_xml_default(tmp_path, capsys):
-    """Test interactive_init with 'n' for XML preference."""
-    # Create existing config to trigger overwrite prompt
-    config_path = tmp_path / CONFIG_FILENAME
-    with open(config_path, "w") as f:
-        json.dump({"version": 1, "ignore_patterns": [], "profiles": {}}, f)
-    
-    with patch('builtins.input', side_effect=['y', '', 'n']):
-        interactive_init(tmp_path)
-    
-    config_path = tmp_path / CONFIG_FILENAME
-    with open(config_path, "r") as f:
-        config = json.load(f)
-    
-    assert config["use_xml"] is False
-
-
-def test_interactive_init_empty_xml_input(tmp_path, capsys):
-    """Test interactive_init with empty XML preference (should default to True)."""
-    with patch('builtins.input', side_effect=['y', '', '']):
-        interactive_init(tmp_path)
-    
-    config_path = tmp_path / CONFIG_FILENAME
-    with open(config_path, "r") as f:
-        config = json.load(f)
-    
-    assert config["use_xml"] is True  # Empty input should default to True
+    assert ("✅ Created" in captured.out) is created
+
+
+def _mk(path, files=(), subdirs=(), n_files=0):
+    """Create a directory with the given empty files, subdirectories and filler files."""
+    path.mkdir()
+    for name in subdirs:
+        (path / name).mkdir()
+    for name in files:
+        (path / name).touch()
+    _create_empty(path, n_files)
+    return path
+
+
+def _create_empty(base, n):
+    """Create n empty filler files with one open/close each, bypassing Path objects."""
+    prefix = f"{base}{os.sep}file"
+    for i in range(n):
+        os.close(os.open(f"{prefix}{i}.txt", os.O_CREAT | os.O_WRONLY, 0o644))
+
+
+@pytest.fixture(scope="session")
+def safety_dirs(tmp_path_factory):
+    """Read-only directory layouts shared by the config safety tests."""
+    base = tmp_path_factory.mktemp("safety")
+    return {
+        "project": _mk(base / "my_project", files=["README.md"], subdirs=["src"]),
+        "empty": _mk(base / "empty_dir"),
+        "git": _mk(base / "git_project", subdirs=[".git"]),
+        "pyproject": _mk(base / "python_project", files=["pyproject.toml"]),
+        "large": _mk(base / "large_project", subdirs=[".git"], n_files=150),
+    }
 
 
 class TestConfigSafety:
     """Test the is_safe_to_create_config function."""
     
-    def test_project_directory(self, tmp_path):
+    def test_project_directory(self, safety_dirs):
         """Test that project directories are safe."""
-        project_dir = tmp_path / "my_project"
-        project_dir.mkdir()
-        (project_dir / "README.md").touch()
-        (project_dir / "src").mkdir()
-        
-        assert is_safe_to_create_config(project_dir)
+        assert is_safe_to_create_config(safety_dirs["project"])
     
-    def test_empty_directory(self, tmp_path):
+    def test_empty_directory(self, safety_dirs):
         """Test that empty directories are safe."""
-        empty_dir = tmp_path / "empty_dir"
-        empty_dir.mkdir()
-        
-        assert is_safe_to_create_config(empty_dir)
+        assert is_safe_to_create_config(safety_dirs["empty"])
     
-    def test_directory_with_git(self, tmp_path):
+    def test_directory_with_git(self, safety_dirs):
         """Test that directories with .git are safe."""
-        git_dir = tmp_path / "git_project"
-        git_dir.mkdir()
-        (git_dir / ".git").mkdir()
-        
-        assert is_safe_to_create_config(git_dir)
+        assert is_safe_to_create_config(safety_dirs["git"])
     
-    def test_directory_with_pyproject(self, tmp_path):
+    def test_directory_with_pyproject(self, safety_dirs):
         """Test that directories with pyproject.toml are safe."""
-        pyproject_dir = tmp_path / "python_project"
-        pyproject_dir.mkdir()
-        (pyproject_dir / "pyproject.toml").touch()
-        
-        assert is_safe_to_create_config(pyproject_dir)
+        assert is_safe_to_create_config(safety_dirs["pyproject"])
     
+    @pytest.mark.xdist_group("system_paths")
     def test_home_directory(self):
         """Test that home directory is not safe."""
-        home_dir = Path.home()
+        home_dir = _HOME
         # Note: This test might fail in CI environments where home is a test directory
         # We'll skip it if home looks like a test directory
         if "test" not in str(home_dir).lower() and "tmp" not in str(home_dir).lower():
             assert not is_safe_to_create_config(home_dir)
     
+    @pytest.mark.xdist_group("system_paths")
     def test_root_directory(self):
         """Test that root directory is not safe."""
         # Skip on Windows or if we can't access root
         if sys.platform != "win32":
-            root_dir = Path("/")
+            root_dir = _ROOT
             assert not is_safe_to_create_config(root_dir)
     
+    @pytest.mark.xdist_group("system_paths")
     def test_etc_directory(self):
         """Test that /etc directory is not safe."""
         if sys.platform != "win32":
-            etc_dir = Path("/etc")
+            etc_dir = _ETC
             if etc_dir.exists():
                 assert not is_safe_to_create_config(etc_dir)
     
+    @pytest.mark.xdist_group("system_paths")
     def test_tmp_directory(self):
         """Test that /tmp directory is safe (common for temporary projects)."""
         if sys.platform != "win32":
-            tmp_dir = Path("/tmp")
+            tmp_dir = _TMP
             if tmp_dir.exists():
                 # /tmp should be safe for temporary projects
                 assert is_safe_to_create_config(tmp_dir)
     
-    def test_large_project_directory(self, tmp_path):
+    def test_large_project_directory(self, safety_dirs):
         """Test that large directories WITH project indicators are safe."""
-        # Create a directory with many files AND project indicators
-        large_project_dir = tmp_path / "large_project"
-        large_project_dir.mkdir()
-        (large_project_dir / ".git").mkdir()  # Project indicator
-        
-        # Create many files
-        for _ in range(150):
-            (large_project_dir / f"file{_}.txt").touch()
-        
-        # Should be safe (has project indicator)
-        assert is_safe_to_create_config(large_project_dir)
+        assert is_safe_to_create_config(safety_dirs["large"])
     
-    def test_permission_error_handling(self, tmp_path):
+    def test_permission_error_handling(self, safety_dirs):
         """Test that permission errors are handled gracefully."""
-        test_dir = tmp_path / "test_dir"
-        test_dir.mkdir()
-        
-        result = is_safe_to_create_config(test_dir)
+        result = is_safe_to_create_config(safety_dirs["empty"])
         assert isinstance(result, bool)
 
 
@@ -389,7 +382,7 @@ def test_increment_config_version(tmp_path):
     
     increment_config_version(tmp_path)
     
-    updated_config = json.loads(config_path.read_text())
+    updated_config = json.loads(config_path.read_bytes())
     assert updated_config["version"] == 6
     assert "profiles" in updated_config
 
@@ -408,7 +401,7 @@ def test_increment_config_version_invalid_version(tmp_path):
     
     increment_config_version(tmp_path)
     
-    updated_config = json.loads(config_path.read_text())
+    updated_config = json.loads(config_path.read_bytes())
     assert updated_config["version"] == 1  # Should reset to 1
 
 
@@ -420,7 +413,7 @@ def test_increment_config_version_no_version_field(tmp_path):
     
     increment_config_version(tmp_path)
     
-    updated_config = json.loads(config_path.read_text())
+    updated_config = json.loads(config_path.read_bytes())
     assert updated_config["version"] == 1  # Should add version field
 
 
@@ -433,7 +426,7 @@ def test_increment_config_version_with_logger(tmp_path):
     mock_logger = Mock()
     increment_config_version(tmp_path, mock_logger)
     
-    updated_config = json.loads(config_path.read_text())
+    updated_config = json.loads(config_path.read_bytes())
     assert updated_config["version"] == 11
     # Logger should not be called for normal operation
 
@@ -485,80 +478,65 @@ def test_validate_config_profile_with_run_commands():
 
 
 @pytest.mark.edge_case
-def test_config_save_failure_logging(tmp_path, capsys):
+def test_config_save_failure_logging(tmp_path, capsys, monkeypatch, raiser):
     """Cover config.py:122-126 (Handling write failures on config creation)"""
-    import builtins
-    # Force open to fail only when writing (mode 'w')
-    original_open = builtins.open
-    def side_effect(file, mode, *args, **kwargs):
-        if "w" in mode and ".dump_config.json" in str(file):
-            raise OSError("Disk Full")
-        return original_open(file, mode, *args, **kwargs)
-
-    with patch("builtins.open", side_effect=side_effect):
-        load_or_create_config(tmp_path)
+    monkeypatch.setattr("dumpcode.config._write_json", raiser(OSError("Disk Full")))
+    load_or_create_config(tmp_path)
     
     captured = capsys.readouterr()
     assert "[Error] Could not save config: Disk Full" in captured.out
 
 
 @pytest.mark.edge_case
-def test_increment_version_exception(tmp_path, capsys):
+def test_increment_version_exception(tmp_path, capsys, monkeypatch, raiser):
     """Cover config.py:154-158 (Exception handling in version increment)"""
     config_path = tmp_path / ".dump_config.json"
     config_path.write_text('{"version": 1}')
     
-    with patch("json.load", side_effect=RuntimeError("Corrupt Memory")):
-        increment_config_version(tmp_path)
-        
+    monkeypatch.setattr("dumpcode.config._read_json", raiser(RuntimeError("Corrupt Memory")))
+    increment_config_version(tmp_path)
+    
     captured = capsys.readouterr()
     assert "[Error] Could not increment config version" in captured.out
 
 
-# Consolidated tests from test_coverage_final_push.py
-def test_config_print_fallbacks(tmp_path, capsys):
-    """Cover config.py:102, 111, 124, 156 (Standard output if logger is missing)"""
-    from dumpcode.config import load_or_create_config, increment_config_version
-    
-    config_path = tmp_path / ".dump_config.json"
-    
-    # 1. Invalid structure warning
-    config_path.write_text('{"version": "wrong"}')
-    load_or_create_config(tmp_path, logger=None)
-    assert "Config file has invalid structure" in capsys.readouterr().out
+@pytest.mark.parametrize("fast_json", [True, False], ids=["orjson", "stdlib"])
+def test_read_json_backends(tmp_path, monkeypatch, fast_json):
+    """Config loading gives the same result with and without orjson."""
+    if fast_json:
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr("dumpcode.config.orjson", None)
+    (tmp_path / CONFIG_FILENAME).write_bytes(SEED_CONFIG_BYTES)
 
-    # 2. Save failure error
-    with patch("json.dump", side_effect=OSError("ReadOnly")):
-        load_or_create_config(tmp_path, logger=None)
-    assert "Could not save config" in capsys.readouterr().out
+    config = load_or_create_config(tmp_path)
 
-    # 3. Increment failure error
-    config_path.write_text('{"version": 1}')
-    with patch("json.load", side_effect=Exception("Corrupt")):
-        increment_config_version(tmp_path, logger=None)
-    assert "Could not increment config version" in capsys.readouterr().out
+    assert config["version"] == 5
+    assert config["ignore_patterns"] == ["*.pyc", "node_modules"]
+    assert "custom" in config["profiles"]
 
 
-# Consolidated tests from test_final_coverage.py
-def test_config_print_fallbacks_2(tmp_path, capsys):
-    """Cover config.py:102, 111, 124, 156 (Print when logger is None)"""
-    from dumpcode.config import load_or_create_config, increment_config_version
-    
-    config_path = tmp_path / ".dump_config.json"
-    
-    # Force invalid config to trigger warning
-    config_path.write_text('{"version": "wrong_type"}')
-    load_or_create_config(tmp_path, logger=None)
+@pytest.mark.parametrize(
+    "scenario,expected",
+    [
+        ("invalid", "[Warning] Config file has invalid structure"),
+        ("save_fail", "[Error] Could not save config"),
+        ("incr_fail", "[Error] Could not increment config version"),
+    ],
+)
+def test_config_print_fallbacks(tmp_path, capsys, monkeypatch, scenario, expected, raiser):
+    """Cover config.py:102, 111, 124, 156 (Standard output if logger is missing)"""
+    config_path = tmp_path / CONFIG_FILENAME
     
-    # Force exception during save
-    with patch("json.dump", side_effect=OSError("Disk Full")):
+    if scenario == "invalid":
+        config_path.write_text('{"version": "wrong"}')
         load_or_create_config(tmp_path, logger=None)
-        
-    # Force exception during version increment
-    with patch("json.load", side_effect=Exception("Corrupt")):
+    elif scenario == "save_fail":
+        monkeypatch.setattr("dumpcode.config._write_json", raiser(OSError("ReadOnly")))
+        load_or_create_config(tmp_path, logger=None)
+    else:
+        config_path.write_text('{"version": 1}')
+        monkeypatch.setattr("dumpcode.config._read_json", raiser(Exception("Corrupt")))
         increment_config_version(tmp_path, logger=None)
-
-    captured = capsys.readouterr()
-    assert "Config file has invalid structure" in captured.out
-    assert "[Error] Could not save config" in captured.out
-    assert "[Error] Could not increment config version" in captured.out
\ No newline at end of file
+    
+    assert expected in capsys.readouterr().out
@@ -288,4 +288,118 @@ def test_core_traversal_race_conditions(tmp_path):
         # Check that an error entry was created
         assert len(session.tree_entries) > 0
         # The error message format might be different
-        assert session.tree_entries[0].error_msg is not None
\ No newline at end of file
+        assert session.tree_entries[0].error_msg is not None
+
+
+def test_is_excluded_uses_is_dir_hint(tmp_path):
+    """A caller-supplied is_dir hint is trusted instead of querying the file system."""
+    session = DumpSession(
+        tmp_path, {"build"}, None, False, included_patterns=["build/keep.txt"]
+    )
+
+    # "build" does not exist on disk, so only the hint can mark it as a directory.
+    assert session.is_excluded(tmp_path / "build", is_dir=True) is False
+
+
+def test_exact_excludes_collect_wildcard_free_patterns(tmp_path):
+    """Literal patterns are collected for the hash lookup; globs and dir rules are not."""
+    session = DumpSession(
+        tmp_path, {"src/main.py", "/setup.py", "*.log", "venv/", "build"}, None, False
+    )
+
+    assert session._exact_excludes == frozenset({"src/main.py", "setup.py", "build"})
+    assert session.is_excluded(tmp_path / "src" / "main.py") is True
+
+
+def test_exact_excludes_disabled_by_negation(tmp_path):
+    """A negation pattern disables the fast path so it can re-include a literal match."""
+    (tmp_path / ".gitignore").write_text("!notes.txt\n")
+    session = DumpSession(tmp_path, {"notes.txt"}, None, False)
+
+    assert session._exact_excludes == frozenset()
+    assert session.is_excluded(tmp_path / "notes.txt") is False
+
+
+def test_dir_prune_names_skip_nested_excluded_dirs(tmp_path):
+    """Literal directory patterns prune matching directories at any depth unscanned."""
+    nested = tmp_path / "pkg" / "node_modules"
+    (nested / "lib").mkdir(parents=True)
+    (nested / "lib" / "index.js").touch()
+    (tmp_path / "pkg" / "main.py").touch()
+    session = DumpSession(tmp_path, {"node_modules", "venv/", "src/main.py"}, None, False)
+
+    assert session._dir_prune_names == frozenset({"node_modules"})
+
+    with patch.object(session.matcher, "match_file", wraps=session.matcher.match_file) as spy:
+        session.generate_tree(tmp_path)
+
+    assert "pkg/node_modules" not in [c.args[0] for c in spy.call_args_list]
+    assert session.files_to_dump == [tmp_path / "pkg" / "main.py"]
+
+
+def test_trailing_slash_dir_rules_match_pathspec(tmp_path):
+    """Directories named by 'dir/' rules get the same verdict and tree entry as pathspec gives."""
+    for rel in ("venv/lib", "build", "src/build", "node_modules"):
+        (tmp_path / rel).mkdir(parents=True)
+    (tmp_path / "venv" / "lib" / "site.py").touch()
+    (tmp_path / "build" / "out.txt").touch()
+    (tmp_path / "src" / "app.py").touch()
+    (tmp_path / ".gitignore").write_text("venv/\nbuild/\n")
+    session = DumpSession(tmp_path, {"node_modules"}, None, False)
+
+    for rel in ("venv", "build", "src/build", "node_modules"):
+        expected = session.matcher.match_file(rel)
+        assert session.is_excluded(tmp_path / rel, is_dir=True) is expected
+
+    session.generate_tree(tmp_path)
+
+    assert session.dir_count == 4
+    assert sorted(session.files_to_dump) == [tmp_path / ".gitignore", tmp_path / "src" / "app.py"]
+
+
+def test_realpath_only_for_root_and_symlinks(tmp_path):
+    """Plain subdirectories inherit their parent's real path; only links are resolved."""
+    (tmp_path / "a" / "b" / "c").mkdir(parents=True)
+    os.symlink(tmp_path / "a", tmp_path / "a" / "b" / "loop")
+    session = DumpSession(tmp_path, set(), None, False)
+
+    with patch("dumpcode.core.os.path.realpath", wraps=os.path.realpath) as spy:
+        session.generate_tree(tmp_path)
+
+    assert spy.call_count == 2
+    assert any(entry.is_recursive_link for entry in session.tree_entries)
+
+
+def test_is_excluded_accepts_plain_strings(tmp_path):
+    """String paths (as yielded by DirEntry.path) get the same verdicts as Path objects."""
+    session = DumpSession(tmp_path, {"*.log", "src/main.py"}, None, False)
+
+    assert session.is_excluded(str(tmp_path / "src" / "main.py")) is True
+    assert session.is_excluded(str(tmp_path / "logs" / "app.log")) is True
+    assert session.is_excluded(str(tmp_path / "src" / "util.py")) is False
+    assert session.is_excluded(str(tmp_path / CONFIG_FILENAME)) is True
+
+
+def test_match_prefilter_never_hides_a_match(tmp_path):
+    """Paths the prefilter rules out are never matched by the full pathspec."""
+    patterns = {"*.pyc", "*.egg-info", "venv", "build/", "/dist", "docs/_build/*", "!keep.pyc"}
+    session = DumpSession(tmp_path, patterns, None, False)
+    paths = [
+        "a.pyc", "src/a.pyc", "pkg.egg-info/PKG-INFO", "venv", "x/venv/lib.py",
+        "build/out.o", "src/build/o", "dist", "dist/x.whl", "src/dist/x",
+        "docs/_build/index.html", "docs/index.md", "src/main.py", "keep.pyc", "README",
+    ]
+
+    assert session._match_prefilter is not None
+    for rel in paths:
+        if not session._may_match(rel):
+            assert not session.matcher.match_file(rel), rel
+    assert not session._may_match("src/main.py")
+
+
+def test_match_prefilter_disabled_for_general_globs(tmp_path):
+    """A pattern that cannot be summarised turns the prefilter off."""
+    session = DumpSession(tmp_path, {"*.pyc", "*.py[cod]"}, None, False)
+
+    assert session._match_prefilter is None
+    assert session.is_excluded(tmp_path / "mod.pyo") is True
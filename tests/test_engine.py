@@ -1,168 +1,125 @@
 """Integration tests for DumpEngine."""
 
 import logging
-import pytest
+import sys
+import time
+from pathlib import Path
 from unittest.mock import patch, Mock, MagicMock
-from dumpcode.constants import DEFAULT_PROFILES
-from dumpcode.core import DumpSettings, DumpSession
-from dumpcode.engine import DumpEngine
 
+import pytest
 
-def test_engine_output_sandwich(tmp_path, validate_xml):
-    """Test the complete sandwich output structure."""
-    src = tmp_path / "src"
-    src.mkdir()
-    (src / "hello.py").write_text("print('hi')")
-    
+from dumpcode.constants import DEFAULT_PROFILES
+from dumpcode.core import DumpSettings, DumpSession
+from dumpcode.engine import FILE_READ_WORKERS, DumpEngine
+
+
+@pytest.fixture(scope="module")
+def engine_project(tmp_path_factory, make_tree):
+    """Build one source tree shared by the read-only engine output tests.
+
+    Dumps are written outside this tree so one case's output never shows up
+    in another case's scan.
+    """
+    return make_tree(tmp_path_factory.mktemp("engine_project"), {
+        "src/dir1/": "",
+        "src/hello.py": "print('hi')",
+        "src/keep.py": "def foo(): pass",
+        'src/bad"name.txt': "x < y && z > a",
+    })
+
+
+XML_SKELETON = frozenset({b"<instructions>", b"<task>", b"<dump version=", b"<tree>", b"<files>"})
+"""Top-level tags every XML dump must contain."""
+
+MAX_DEPTH_VISIBLE = frozenset({b"dir1/", b"file1.txt", b"dir2/", b"file2.txt"})
+"""Entries of deep_project at depth <= 2."""
+
+MAX_DEPTH_HIDDEN = frozenset({b"file3.txt"})
+"""Entries of deep_project below depth 2."""
+
+
+@pytest.mark.parametrize(
+    "settings_kwargs, config, expected, unexpected",
+    [
+        pytest.param(
+            {"active_profile": DEFAULT_PROFILES["readme"]},
+            {"ignore_patterns": []},
+            XML_SKELETON | {
+                b"<file path=\"src/hello.py\">",
+                b"print('hi')",
+                b"Act as a Senior Technical Writer",
+                b"Output the result in raw Markdown format",
+            },
+            [],
+            id="output_sandwich",
+        ),
+        pytest.param(
+            {},
+            {"ignore_patterns": []},
+            XML_SKELETON | {
+                b"<file path=\"src/keep.py\">",
+                b"def foo(): pass",
+                b"Act as an expert software developer and system architect.",
+                b"Analyze the provided codebase",
+            },
+            [],
+            id="without_profile",
+        ),
+        pytest.param(
+            {"structure_only": True},
+            {"ignore_patterns": []},
+            [b"<tree>", b"<files>"],
+            [b"<file path="],
+            id="structure_only",
+        ),
+        pytest.param(
+            {},
+            {"ignore_patterns": ["*.py", "*.txt"]},
+            [],
+            [b"hello.py", b"keep.py", b"<file path="],
+            id="ignore_patterns",
+        ),
+        pytest.param(
+            {"dir_only": True},
+            {"ignore_patterns": []},
+            [b"src/", b"dir1/", b"<files>", b"[No files found]"],
+            [b"hello.py"],
+            id="dir_only",
+        ),
+        pytest.param(
+            {},
+            {"ignore_patterns": []},
+            [
+                b'<file path="src/bad&quot;name.txt">',
+                b"x &lt; y &amp;&amp; z &gt; a",
+                b"</file>",
+            ],
+            [],
+            id="xml_safety_escaping",
+        ),
+    ],
+)
+def test_engine_output(
+    engine_project, tmp_path, validate_xml, assert_contains_all,
+    settings_kwargs, config, expected, unexpected
+):
+    """Test the dump content produced for each settings variation."""
     out_file = tmp_path / "dump.txt"
-    # Use a profile name that exists in DEFAULT_PROFILES
-    test_profile = DEFAULT_PROFILES["readme"]
-    
     settings = DumpSettings(
-        start_path=tmp_path,
+        start_path=engine_project,
         output_file=out_file,
         use_xml=True,
-        active_profile=test_profile
+        **settings_kwargs,
     )
-    
-    engine = DumpEngine(config={"ignore_patterns": []}, settings=settings)
-    engine.run()
-    
-    content = out_file.read_text()
-    
-    # Verify semantic XML structure
-    assert "<instructions>" in content
-    assert "<task>" in content
-    assert "<dump version=" in content
-    assert "<tree>" in content
-    assert "<files>" in content
-    assert "<file path=\"src/hello.py\">" in content
-    assert "print('hi')" in content
-    assert "Act as a Senior Technical Writer" in content
-    assert "Output the result in raw Markdown format" in content
-    
-    # Validate XML structure
-    validate_xml(content)
 
+    DumpEngine(config=config, settings=settings).run()
 
-def test_engine_without_profile(tmp_path):
-    """Test engine with no active profile."""
-    src = tmp_path / "src"
-    src.mkdir()
-    (src / "test.py").write_text("def foo(): pass")
-    
-    out_file = tmp_path / "dump.txt"
-    settings = DumpSettings(
-        start_path=tmp_path,
-        output_file=out_file,
-        use_xml=True,  # Always XML now
-        active_profile=None
-    )
-    
-    engine = DumpEngine(config={"ignore_patterns": []}, settings=settings)
-    engine.run()
-    
-    content = out_file.read_text()
-    
-    # Should use default prompts in XML structure
-    assert "<instructions>" in content
-    assert "<task>" in content
-    assert "<dump version=" in content
-    assert "<tree>" in content
-    assert "<files>" in content
-    assert "<file path=\"src/test.py\">" in content
-    assert "def foo(): pass" in content
-    assert "Act as an expert software developer and system architect." in content
-    assert "Analyze the provided codebase" in content
-
-
-def test_engine_structure_only(tmp_path):
-    """Test engine with structure-only mode."""
-    src = tmp_path / "src"
-    src.mkdir()
-    (src / "file1.py").write_text("content1")
-    (src / "file2.py").write_text("content2")
-    
-    out_file = tmp_path / "dump.txt"
-    settings = DumpSettings(
-        start_path=tmp_path,
-        output_file=out_file,
-        structure_only=True,
-        use_xml=True,
-        active_profile=None
-    )
-    
-    engine = DumpEngine(config={"ignore_patterns": []}, settings=settings)
-    engine.run()
-    
-    content = out_file.read_text()
-    
-    # Should have tree but no file contents (files section will be empty)
-    assert "<tree>" in content
-    assert "<files>" in content
-    assert "<file path=" not in content  # No files in structure-only mode
-
-
-def test_engine_with_ignore_patterns(tmp_path):
-    """Test engine with ignore patterns."""
-    src = tmp_path / "src"
-    src.mkdir()
-    (src / "keep.py").write_text("keep this")
-    (src / "ignore.py").write_text("ignore this")
-    
-    out_file = tmp_path / "dump.txt"
-    settings = DumpSettings(
-        start_path=tmp_path,
-        output_file=out_file,
-        use_xml=True,
-        active_profile=None
-    )
-    
-    engine = DumpEngine(
-        config={"ignore_patterns": ["*.py"]},  # Ignore all Python files
-        settings=settings
-    )
-    engine.run()
-    
-    content = out_file.read_text()
-    
-    # Should not have the ignored file
-    assert "keep.py" not in content
-    assert "ignore.py" not in content
-    assert "<file path=" not in content
-
-
-def test_engine_dir_only_mode(tmp_path):
-    """Test engine with directory-only mode."""
-    src = tmp_path / "src"
-    src.mkdir()
-    (src / "dir1").mkdir()
-    (src / "file1.py").write_text("content")
-    
-    out_file = tmp_path / "dump.txt"
-    settings = DumpSettings(
-        start_path=tmp_path,
-        output_file=out_file,
-        dir_only=True,
-        use_xml=True,
-        active_profile=None
-    )
-    
-    engine = DumpEngine(config={"ignore_patterns": []}, settings=settings)
-    engine.run()
-    
-    content = out_file.read_text()
-    
-    # Should have directories but no files in tree
-    assert "src/" in content
-    assert "dir1/" in content
-    assert "file1.py" not in content
-    # With dir_only=True, files_to_dump should be empty
-    assert "<files>" in content
-    assert "[No files found]" in content
+    data = out_file.read_bytes()
+    assert_contains_all(data, expected, unexpected)
+    validate_xml(data.decode("utf-8"))
 
 
-def test_engine_max_depth(deep_project, settings_factory, validate_xml):
+def test_engine_max_depth(deep_project, settings_factory, validate_xml, assert_contains_all):
     """Test engine with max depth limit."""
     settings = settings_factory(
         start_path=deep_project,
@@ -174,61 +131,19 @@ def test_engine_max_depth(deep_project, settings_factory, validate_xml):
     engine = DumpEngine(config={"ignore_patterns": []}, settings=settings)
     engine.run()
     
-    content = settings.output_file.read_text()
+    data = settings.output_file.read_bytes()
     
-    # Should have dir1 and dir2 (depth 1 and 2)
-    # Note: max_depth=2 means depth 0 (root), depth 1 (dir1), depth 2 (dir2)
-    assert "dir1/" in content
-    assert "file1.txt" in content
-    # dir2 should appear as a directory (since it's a child of dir1 at depth 2)
-    # file2.txt should appear (depth 2)
-    assert "dir2/" in content
-    assert "file2.txt" in content  # file2.txt is at depth 2
-    # file3.txt should not appear (depth 3, beyond max_depth=2)
-    # Note: dir3/ might still appear in the tree structure as an empty directory
-    assert "file3.txt" not in content  # file3.txt is at depth 3
+    # max_depth=2 means depth 0 (root), depth 1 (dir1), depth 2 (dir2 and file2.txt).
+    # file3.txt is at depth 3; dir3/ might still appear as an empty directory.
+    assert_contains_all(data, MAX_DEPTH_VISIBLE, MAX_DEPTH_HIDDEN)
     
     # Validate XML structure
-    validate_xml(content)
-
-
-def test_xml_safety_escaping(tmp_path, validate_xml):
-    """Test that XML special characters are properly escaped in output."""
-    # Create file with problematic name and content
-    src = tmp_path / "src"
-    src.mkdir()
-    (src / 'bad"name.txt').write_text('x < y && z > a')
-    
-    out_file = tmp_path / "dump.txt"
-    settings = DumpSettings(
-        start_path=tmp_path,
-        output_file=out_file,
-        use_xml=True,
-        active_profile=None
-    )
-    
-    engine = DumpEngine(config={"ignore_patterns": []}, settings=settings)
-    engine.run()
-    
-    content = out_file.read_text()
-    
-    # Verify XML escaping
-    # Path should have double quotes escaped (path includes src/ prefix)
-    assert 'path="src/bad&quot;name.txt"' in content
-    # Content should have <, >, and & escaped
-    assert 'x &lt; y &amp;&amp; z &gt; a' in content
-    # Verify the XML is well-formed (no raw <, >, or & characters in content)
-    assert '<file path="src/bad&quot;name.txt">' in content
-    assert '</file>' in content
-    
-    # Validate XML structure
-    validate_xml(content)
+    validate_xml(data.decode("utf-8"))
 
 
 @pytest.mark.edge_case
 def test_engine_verbose_debug_logs(project_env, default_settings, caplog):
     """Cover engine.py:60, 65, 73, 80 (Debug logging branches)"""
-    import logging
     default_settings.verbose = True
     # Ensure logger is at DEBUG level
     logger = logging.getLogger("dumpcode")
@@ -282,11 +197,10 @@ def test_engine_tool_missing_hint(project_env, default_settings, caplog):
 
 
 @pytest.mark.edge_case
-def test_engine_token_limit_warning(project_env, default_settings, caplog):
+def test_engine_token_limit_warning(tmp_path, caplog):
     """Cover engine.py:199 (Token limit warning for massive dumps)"""
-    from unittest.mock import Mock
-    from pathlib import Path
-    engine = DumpEngine({"ignore_patterns": []}, default_settings)
+    settings = DumpSettings(start_path=tmp_path, output_file=tmp_path / "dummy.txt", no_copy=True)
+    engine = DumpEngine({"ignore_patterns": []}, settings)
     
     # Mock finalize with high char count (~200k tokens)
     with caplog.at_level(logging.WARNING):
@@ -302,9 +216,6 @@ def test_engine_token_limit_warning(project_env, default_settings, caplog):
 # Consolidated tests from test_coverage_final_push.py
 def test_engine_output_dir_creation_logic(tmp_path):
     """Cover engine.py:103-105 (Creation of missing output parent directories)"""
-    from dumpcode.core import DumpSettings
-    from dumpcode.engine import DumpEngine
-    
     # Define a path that definitely doesn't exist
     deep_path = tmp_path / "subdir_a" / "subdir_b" / "dump.txt"
     settings = DumpSettings(
@@ -322,9 +233,6 @@ def test_engine_output_dir_creation_logic(tmp_path):
 
 def test_engine_prompt_priority_logic(tmp_path):
     """Cover engine.py:149-151 (Hierarchy: Question > Profile Post > Default Post)"""
-    from dumpcode.core import DumpSettings
-    from dumpcode.engine import DumpEngine
-    
     out_file = tmp_path / "out.txt"
     
     # Create a test file so there's something to dump
@@ -340,20 +248,32 @@ def test_engine_prompt_priority_logic(tmp_path):
     )
     engine = DumpEngine(config={}, settings=settings)
     
-    # Mock _finalize to avoid profile comparison issues
-    with patch.object(engine, '_finalize') as mock_finalize:
-        engine.run()
+    # Stub _finalize on the instance to skip clipboard and version side effects
+    finalize_calls = []
+    engine._finalize = lambda *args, **kwargs: finalize_calls.append(args)
+    engine.run()
     
     # The actual content check would require examining the output
     # For coverage purposes, we just need to exercise the code path
-    assert mock_finalize.called
+    assert finalize_calls
+
+
+def _runner_not_found(cmd):
+    """Mock runner returning 127 (Command not found)."""
+    return (127, "bash: command not found")
+
 
+def _runner_pytest_fail(cmd):
+    """Mock runner returning non-zero for pytest."""
+    return (1, "pytest failed")
 
-def test_engine_command_hints_and_failures(tmp_path, caplog):
+
+@pytest.mark.parametrize("runner,needle", [
+    (_runner_not_found, "Is the tool installed"),
+    (_runner_pytest_fail, "Install pytest-cov"),
+])
+def test_engine_command_hints_and_failures(tmp_path, caplog, runner, needle):
     """Cover engine.py:137, 141-143 (Hints for Exit Code 127 and pytest-cov)"""
-    from dumpcode.core import DumpSettings
-    from dumpcode.engine import DumpEngine
-    
     config = {
         "profiles": {
             "test": {"run_commands": ["pytest --cov=src"]}
@@ -364,34 +284,15 @@ def test_engine_command_hints_and_failures(tmp_path, caplog):
         output_file=tmp_path/"out.txt", 
         active_profile=config["profiles"]["test"]
     )
-    
-    # Mock runner returning 127 (Command not found)
-    def mock_runner_127(cmd):
-        return (127, "bash: command not found")
-        
-    engine = DumpEngine(config, settings, cmd_runner=mock_runner_127)
-    with caplog.at_level(logging.WARNING):
-        engine.run()
-    assert "Is the tool installed" in caplog.text
 
-    # Mock runner returning non-zero for pytest
-    caplog.clear()
-    def mock_runner_pytest_fail(cmd):
-        return (1, "pytest failed")
-    
-    engine = DumpEngine(config, settings, cmd_runner=mock_runner_pytest_fail)
+    engine = DumpEngine(config, settings, cmd_runner=runner)
     with caplog.at_level(logging.WARNING):
         engine.run()
-    assert "Install pytest-cov" in caplog.text
+    assert needle in caplog.text
 
 
 def test_engine_finalize_profile_resolution_and_token_warning(tmp_path, caplog):
     """Cover engine.py:199 (Token warning) and 206-207 (Profile name lookup)"""
-    from dumpcode.constants import DEFAULT_PROFILES
-    from dumpcode.core import DumpSettings
-    from dumpcode.engine import DumpEngine
-    from unittest.mock import Mock
-    
     settings = DumpSettings(start_path=tmp_path, output_file=tmp_path/"out.txt", no_copy=True)
     engine = DumpEngine(config={}, settings=settings)
     
@@ -404,18 +305,15 @@ def test_engine_finalize_profile_resolution_and_token_warning(tmp_path, caplog):
     assert "prepended to output" in caplog.text
 
 
-def test_engine_global_exception_handler(tmp_path, caplog):
+def test_engine_global_exception_handler(tmp_path, caplog, monkeypatch, raiser):
     """Cover engine.py:169-170 (Error logging when dump crashes)"""
-    from dumpcode.core import DumpSettings
-    from dumpcode.engine import DumpEngine
-    
     settings = DumpSettings(start_path=tmp_path, output_file=tmp_path/"err.txt")
     engine = DumpEngine(config={}, settings=settings)
     
     # Force an error by patching generate_tree
-    with patch.object(DumpSession, "generate_tree", side_effect=RuntimeError("Hard Crash")):
-        with pytest.raises(RuntimeError):
-            engine.run()
+    monkeypatch.setattr(DumpSession, "generate_tree", raiser(RuntimeError("Hard Crash")))
+    with pytest.raises(RuntimeError):
+        engine.run()
     # Check for error log - it might be logged at a different level
     # The important thing is that the code path is exercised
     # We'll check the actual log output from the test run
@@ -437,24 +335,25 @@ class TestEngineGaps:
         
         engine = DumpEngine(config={}, settings=settings)
         
-        # Mock the _finalize method to avoid profile comparison issues
-        with patch.object(engine, '_finalize') as mock_finalize:
-            engine.run()
+        # Stub _finalize on the instance to skip clipboard and version side effects
+        finalize_calls = []
+        engine._finalize = lambda *args, **kwargs: finalize_calls.append(args)
+        engine.run()
             
         # Check that default prompts were used
-        # The actual content check would be in the output file, but we're mocking finalize
+        # The actual content check would be in the output file, but we're stubbing finalize
         # For coverage, we just need to ensure the code paths are executed
-        assert mock_finalize.called
+        assert finalize_calls
 
-    def test_engine_run_top_level_exception(self, tmp_path, caplog):
+    def test_engine_run_top_level_exception(self, tmp_path, caplog, monkeypatch, raiser):
         """Cover engine.py:169-170 (Global exception handler)"""
         settings = DumpSettings(start_path=tmp_path, output_file=tmp_path/"err.txt")
         engine = DumpEngine(config={}, settings=settings)
         
         # Force a crash during tree generation
-        with patch.object(DumpSession, "generate_tree", side_effect=RuntimeError("Fatal Crash")):
-            with pytest.raises(RuntimeError):
-                engine.run()
+        monkeypatch.setattr(DumpSession, "generate_tree", raiser(RuntimeError("Fatal Crash")))
+        with pytest.raises(RuntimeError):
+            engine.run()
         
         # Check for error log - need to check at ERROR level
         # The error might be logged at different levels or formats
@@ -463,7 +362,6 @@ class TestEngineGaps:
 
     def test_engine_finalize_profile_name_resolution(self, tmp_path, caplog):
         """Cover engine.py:206-207 (Profile name lookup in finalize)"""
-        from dumpcode.constants import DEFAULT_PROFILES
         engine = DumpEngine(config={}, settings=Mock(git_changed_only=False, start_path=tmp_path, no_copy=True))
         
         # Use a real profile object from defaults
@@ -478,9 +376,6 @@ class TestEngineGaps:
 # Consolidated tests from test_final_coverage.py
 def test_engine_directory_creation_and_limit_warnings(tmp_path, caplog):
     """Cover engine.py:99 (Dir creation) and 199 (Token warning)"""
-    from dumpcode.core import DumpSettings
-    from dumpcode.engine import DumpEngine
-    
     # 1. Test directory creation - the directory should be created by the writer
     # For this test, we'll just verify the token warning logic
     nested_out = tmp_path / "new_dir" / "dump.txt"
@@ -501,9 +396,6 @@ def test_engine_directory_creation_and_limit_warnings(tmp_path, caplog):
 
 def test_engine_missing_tool_hints(tmp_path, caplog):
     """Cover engine.py:137, 141 (Hints for Exit Code 127)"""
-    from dumpcode.core import DumpSettings
-    from dumpcode.engine import DumpEngine
-    
     config = {"profiles": {"bad-tool": {"run_commands": ["pytest --cov"]}}}
     settings = DumpSettings(
         start_path=tmp_path, 
@@ -537,10 +429,6 @@ def test_engine_exit_code_127_hint(caplog):
 
 def test_handle_ai_mode_no_sdk_installed(caplog):
     """Test that _handle_ai_mode handles missing AI SDK gracefully."""
-    from dumpcode.engine import DumpEngine
-    from pathlib import Path
-    import sys
-    
     # Force an ImportError when the engine tries to import the AI module
     with patch.dict(sys.modules, {'dumpcode.ai': None}):
         engine = DumpEngine(config={}, settings=MagicMock(auto_mode=True))
@@ -553,8 +441,6 @@ def test_handle_ai_mode_no_sdk_installed(caplog):
 
 def test_engine_command_hint_coverage(caplog):
     """Verify that we provide hints for 'command not found' (Exit 127)."""
-    from dumpcode.engine import DumpEngine
-    
     engine = DumpEngine(config={}, settings=MagicMock(verbose=False))
     # Mock a command not found
     engine.cmd_runner = MagicMock(return_value=(127, "sh: linter: not found"))
@@ -570,9 +456,6 @@ def test_engine_command_hint_coverage(caplog):
 
 def test_engine_finalize_token_estimation_error(tmp_path, caplog):
     """Verify lines 195-198: Handle errors during token estimation in finalize."""
-    from dumpcode.engine import DumpEngine
-    from unittest.mock import Mock
-    
     settings = Mock(start_path=tmp_path, output_file=tmp_path/"out.txt", auto_mode=False, no_copy=True)
     engine = DumpEngine(config={}, settings=settings)
     
@@ -582,4 +465,48 @@ def test_engine_finalize_token_estimation_error(tmp_path, caplog):
         # Passing total_chars as None to force a TypeError inside the try block
         engine._finalize(tmp_path/"out.txt", Mock(dir_count=1, file_count=1), None, None)
     
-    assert "Could not estimate tokens" in caplog.text
\ No newline at end of file
+    assert "Could not estimate tokens" in caplog.text
+
+def test_engine_finalize_unlisted_profile_is_not_named(tmp_path, caplog):
+    """An ad-hoc profile missing from the config is not named in the summary log."""
+    settings = DumpSettings(start_path=tmp_path, output_file=tmp_path / "out.txt", no_copy=True)
+    engine = DumpEngine(config={}, settings=settings)
+
+    assert engine._resolve_profile_name(DEFAULT_PROFILES["readme"]) == "readme"
+    assert engine._resolve_profile_name(dict(DEFAULT_PROFILES["readme"])) == "readme"
+
+    with caplog.at_level(logging.INFO):
+        engine._finalize(tmp_path / "out.txt", Mock(dir_count=0, file_count=0), {"post": "adhoc"}, 0)
+
+    assert "prepended to output" not in caplog.text
+
+
+def test_read_ahead_preserves_order(tmp_path, monkeypatch):
+    """Concurrent reads are yielded in input order even when later files finish first."""
+    files = [tmp_path / f"f{i:02d}.txt" for i in range(40)]
+
+    def fake_read(path, ignore_errors):
+        time.sleep(0.001 * (len(files) - files.index(path)) / 10)
+        return path.name, None
+
+    monkeypatch.setattr("dumpcode.processors.get_file_content", fake_read)
+    settings = DumpSettings(start_path=tmp_path, output_file=tmp_path / "out.txt")
+    engine = DumpEngine(config={}, settings=settings)
+
+    results = list(engine._read_ahead(files))
+
+    assert [path for path, _ in results] == files
+    assert [content for _, (content, _) in results] == [f.name for f in files]
+
+
+def test_read_ahead_small_dump_reads_inline(tmp_path, monkeypatch, raiser):
+    """Dumps of at most FILE_READ_WORKERS files never start a thread pool."""
+    files = [tmp_path / f"f{i}.txt" for i in range(FILE_READ_WORKERS)]
+    monkeypatch.setattr("dumpcode.processors.get_file_content", lambda path, ignore_errors: (path.name, None))
+    monkeypatch.setattr("dumpcode.engine.ThreadPoolExecutor", raiser(AssertionError("pool started")))
+    settings = DumpSettings(start_path=tmp_path, output_file=tmp_path / "out.txt")
+    engine = DumpEngine(config={}, settings=settings)
+
+    results = list(engine._read_ahead(files))
+
+    assert results == [(f, (f.name, None)) for f in files]
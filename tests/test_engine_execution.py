@@ -1,68 +1,75 @@
 """Refactored tests for command execution and output writing functionality."""
 
+import functools
 import io
+from typing import Optional, Tuple
+
 import pytest
 
+from dumpcode.core import DumpSettings
 from dumpcode.engine import DumpEngine
 from dumpcode.writer import DumpWriter
 
 
+def _bytes_writer(use_xml: bool) -> Tuple[io.BytesIO, DumpWriter]:
+    """Build a DumpWriter whose text is encoded straight into a BytesIO."""
+    buf = io.BytesIO()
+    stream = io.TextIOWrapper(buf, encoding="utf-8", newline="", write_through=True)
+    return buf, DumpWriter(stream, use_xml=use_xml)
+
+
 def test_writer_write_command_output():
     """Test DumpWriter.write_command_output with XML escaping."""
-    stream = io.StringIO()
-    writer = DumpWriter(stream, use_xml=True)
+    buf, writer = _bytes_writer(use_xml=True)
     
     test_output = 'Test & output <with> "special" chars'
     writer.write_command_output(test_output)
     
-    result = stream.getvalue()
-    assert "<execution>" in result
-    assert "</execution>" in result
+    result = buf.getvalue()
+    assert b"<execution>" in result
+    assert b"</execution>" in result
     # Quotes don't need to be escaped in XML content, only in attributes
-    assert "Test &amp; output &lt;with&gt; \"special\" chars" in result
+    assert b"Test &amp; output &lt;with&gt; \"special\" chars" in result
 
 
 def test_writer_write_command_output_empty():
     """Test DumpWriter.write_command_output with empty output."""
-    stream = io.StringIO()
-    writer = DumpWriter(stream, use_xml=True)
+    buf, writer = _bytes_writer(use_xml=True)
     
     writer.write_command_output("")
     
-    result = stream.getvalue()
-    assert result == ""  # Should not write anything for empty output
+    result = buf.getvalue()
+    assert result == b""  # Should not write anything for empty output
 
 
 def test_writer_write_command_output_no_xml():
     """Test DumpWriter.write_command_output when XML is disabled."""
-    stream = io.StringIO()
-    writer = DumpWriter(stream, use_xml=False)
+    buf, writer = _bytes_writer(use_xml=False)
     
     test_output = "Test output"
     writer.write_command_output(test_output)
     
-    result = stream.getvalue()
+    result = buf.getvalue()
     # With use_xml=False, write_command_output uses plain text headers
-    assert "--- COMMAND EXECUTION OUTPUT ---" in result
-    assert "Test output" in result
-    assert "<execution>" not in result
+    assert b"--- COMMAND EXECUTION OUTPUT ---" in result
+    assert b"Test output" in result
+    assert b"<execution>" not in result
 
 
 def test_writer_write_command_output_newlines():
     """Test DumpWriter.write_command_output preserves newlines."""
-    stream = io.StringIO()
-    writer = DumpWriter(stream, use_xml=True)
+    buf, writer = _bytes_writer(use_xml=True)
     
     test_output = "Line 1\nLine 2\nLine 3"
     writer.write_command_output(test_output)
     
-    result = stream.getvalue()
-    assert "Line 1\nLine 2\nLine 3" in result
-    assert "<execution>" in result
-    assert "</execution>" in result
+    result = buf.getvalue()
+    assert b"Line 1\nLine 2\nLine 3" in result
+    assert b"<execution>" in result
+    assert b"</execution>" in result
 
 
-def test_engine_run_commands_success(project_env, default_settings):
+def test_engine_run_commands_success(project_env, default_settings, assert_contains_all):
     """Test engine running commands successfully from a profile."""
     config = {
         "version": 1,
@@ -85,15 +92,11 @@ def test_engine_run_commands_success(project_env, default_settings):
     engine = DumpEngine(config, default_settings, cmd_runner=mock_cmd_runner)
     engine.run()
     
-    # Read the output file
-    output_text = default_settings.output_file.read_text()
-    
     # Check that command output appears in the file
-    assert "<execution>" in output_text
-    assert "test output" in output_text
+    assert_contains_all(default_settings.output_file.read_bytes(), [b"<execution>", b"test output"])
 
 
-def test_engine_run_commands_failure(project_env, default_settings):
+def test_engine_run_commands_failure(project_env, default_settings, assert_contains_all):
     """Test engine handling command failures with appropriate logging."""
     config = {
         "version": 1,
@@ -114,15 +117,11 @@ def test_engine_run_commands_failure(project_env, default_settings):
     engine = DumpEngine(config, default_settings, cmd_runner=mock_cmd_runner)
     engine.run()
     
-    output_text = default_settings.output_file.read_text()
-    
-    # Command output should still appear in the file even if it failed
-    assert "<execution>" in output_text
-    # The mock command output should appear
-    assert "Command failed" in output_text
+    # Command output, including the mock failure text, should still appear
+    assert_contains_all(default_settings.output_file.read_bytes(), [b"<execution>", b"Command failed"])
 
 
-def test_engine_run_commands_multiple(project_env, default_settings):
+def test_engine_run_commands_multiple(project_env, default_settings, assert_contains_all):
     """Test engine running multiple commands from a profile."""
     config = {
         "version": 1,
@@ -151,64 +150,61 @@ def test_engine_run_commands_multiple(project_env, default_settings):
     engine = DumpEngine(config, default_settings, cmd_runner=mock_cmd_runner)
     engine.run()
     
-    output_text = default_settings.output_file.read_text()
+    data = default_settings.output_file.read_bytes()
     
     # Check that both command outputs appear
-    assert output_text.count("<execution>") == 2
-    assert "first command" in output_text
-    assert "second command" in output_text
+    assert data.count(b"<execution>") == 2
+    assert_contains_all(data, [b"first command", b"second command"])
     # Verify both commands were called
     assert len(command_calls) == 2
     assert "echo 'first command'" in command_calls
     assert "echo 'second command'" in command_calls
 
 
-def test_engine_run_commands_no_profile(project_env, default_settings):
+@pytest.fixture(scope="module")
+def engine_output(tmp_path_factory, make_tree):
+    """Run the engine over a small project once per profile variant.
+
+    Returns a memoized callable: engine_output(run_commands) gives the dump bytes
+    for a profile with those commands, or for no profile when called without
+    arguments. The runs are deterministic, so read-only assertions share them.
+    """
+    root = make_tree(
+        tmp_path_factory.mktemp("exec_project"),
+        {"src/main.py": 'print("Hello, World!")\n'},
+    )
+
+    @functools.lru_cache(maxsize=None)
+    def _run(run_commands: Optional[Tuple[str, ...]] = None) -> bytes:
+        profile = None
+        if run_commands is not None:
+            profile = {"description": "Test profile", "run_commands": list(run_commands)}
+        output_file = tmp_path_factory.mktemp("exec_output") / "output.txt"
+        settings = DumpSettings(
+            start_path=root, output_file=output_file, active_profile=profile, no_copy=True
+        )
+        DumpEngine({"version": 1}, settings).run()
+        return output_file.read_bytes()
+
+    return _run
+
+
+def test_engine_run_commands_no_profile(engine_output, assert_contains_all):
     """Test engine when no active profile is set."""
-    config = {"version": 1}
-    
-    # Ensure no active profile
-    default_settings.active_profile = None
-    
-    engine = DumpEngine(config, default_settings)
-    engine.run()
-    
-    output_text = default_settings.output_file.read_text()
-    
     # Should not have execution tags when no profile with commands
-    assert "<execution>" not in output_text
+    assert_contains_all(engine_output(), [b"<dump version="], [b"<execution>"])
 
 
-def test_engine_run_commands_empty_command_list(project_env, default_settings):
+def test_engine_run_commands_empty_command_list(engine_output, assert_contains_all):
     """Test engine with profile that has empty command list."""
-    config = {
-        "version": 1,
-        "profiles": {
-            "test-profile": {
-                "description": "Test profile",
-                "run_commands": []  # Empty list
-            }
-        }
-    }
-    
-    default_settings.active_profile = config["profiles"]["test-profile"]
-    
-    engine = DumpEngine(config, default_settings)
-    engine.run()
-    
-    output_text = default_settings.output_file.read_text()
-    
     # Should not have execution tags when command list is empty
-    assert "<execution>" not in output_text
+    assert_contains_all(engine_output(()), [b"<dump version="], [b"<execution>"])
 
 
 @pytest.mark.edge_case
 def test_writer_write_prompt_empty():
     """Cover writer.py:38 (Early return if no prompt is provided)"""
-    from io import StringIO
-    from dumpcode.writer import DumpWriter
-    
-    buf = StringIO()
+    buf = io.StringIO()
     writer = DumpWriter(buf)
     writer.write_prompt("", tag="instructions")
     assert buf.getvalue() == ""
\ No newline at end of file
@@ -1,8 +1,11 @@
 """Unit tests for the formatters module."""
 
+import sys
 from io import StringIO
 from pathlib import Path
 
+import pytest
+
 from dumpcode.formatters import format_ascii_tree
 from dumpcode.writer import DumpWriter
 
@@ -264,4 +267,11 @@ def test_writer_write_skips_format():
     
     result = output.getvalue()
     expected = "  <!-- Skipped Files Summary:\n    - example.py: could not read\n  -->\n"
-    assert result == expected
\ No newline at end of file
+    assert result == expected
+
+@pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need Python 3.10")
+def test_tree_entry_uses_slots(tree_entry_factory):
+    """TreeEntry instances carry no per-instance __dict__."""
+    entry = tree_entry_factory(Path("src"), is_dir=True)
+
+    assert not hasattr(entry, "__dict__")
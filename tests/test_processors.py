@@ -2,8 +2,10 @@
 
 import os
 import pytest
-from unittest.mock import patch
+from pathlib import Path
+from unittest.mock import MagicMock, patch
 from dumpcode.processors import (
+    CONTENT_PROCESSORS,
     get_file_content, 
     truncate_text_lines,
     is_binary_file,
@@ -140,6 +142,39 @@ def test_get_file_content_regular_text_file(tmp_path):
     assert "[... truncated" not in content
 
 
+def test_get_file_content_single_descriptor_read(tmp_path):
+    """Test that get_file_content probes and reads a file through one descriptor."""
+    binary = tmp_path / "blob.dat"
+    binary.write_bytes(b"head\x00tail")
+    text = tmp_path / "big.txt"
+    text.write_text("x" * 10000)
+
+    with patch("dumpcode.processors.os.open", wraps=os.open) as spy:
+        assert get_file_content(binary) == ("[Binary file content omitted]\n", None)
+        assert get_file_content(text) == ("x" * 10000, None)
+
+    assert spy.call_count == 2
+
+
+def test_get_file_content_binary_probe_skips_full_read(tmp_path):
+    """Test that a NUL byte in the first 1 KiB stops the read before the rest of the file."""
+    blob = tmp_path / "blob.dat"
+    blob.write_bytes(b"\x00" + b"x" * 100000)
+
+    with patch("dumpcode.processors.os.read", wraps=os.read) as spy:
+        assert get_file_content(blob) == ("[Binary file content omitted]\n", None)
+
+    assert [c.args[1] for c in spy.call_args_list] == [1024]
+
+
+def test_get_file_content_unopenable_is_binary(tmp_path):
+    """Test that a file that cannot be opened is treated as binary, as is_binary_file does."""
+    p = tmp_path / "locked.txt"
+    p.touch()
+    with patch("os.open", side_effect=PermissionError("Denied")):
+        assert get_file_content(p) == ("[Binary file content omitted]\n", None)
+
+
 # Binary detection test cases
 BINARY_EXTENSION_CASES = [
     ("test.jpg", b"fake jpeg data", True),
@@ -166,7 +201,7 @@ BINARY_CONTENT_CASES = [
     ("python_file.py", "def hello():\n    print('Hello')\n", False),
     ("binary_with_null.bin", b"Hello\x00World", True),
     ("empty.txt", "", False),
-    ("large_text.txt", "x" * 2000, False),
+    ("large_text.txt", b"x" * 2000, False),
     ("utf8_with_bom.txt", b"\xef\xbb\xbfHello World", False),
     ("unicode.txt", "Hello 🌍 World\nEmoji: 😀\n", False),
 ]
@@ -180,6 +215,8 @@ ENCODING_CASES = [
     ("ascii.txt", "Hello, world!".encode("ascii"), ["ascii", "utf-8"]),
     ("utf16le.txt", b"\xff\xfeH\x00e\x00l\x00l\x00o\x00", "utf-16-le"),
     ("utf16be.txt", b"\xfe\xff\x00H\x00e\x00l\x00l\x00o", "utf-16-be"),
+    ("utf32le.txt", b"\xff\xfe\x00\x00H\x00\x00\x00", "utf-32-le"),
+    ("utf32be.txt", b"\x00\x00\xfe\xff\x00\x00\x00H", "utf-32-be"),
     ("binary.bin", b"\x00\x01\x02\x03\x04", "utf-8"),
     ("empty.txt", b"", "utf-8"),
     ("unicode.txt", "Hello 🌍 World 😀 Emoji".encode("utf-8"), "utf-8"),
@@ -187,45 +224,71 @@ ENCODING_CASES = [
 ]
 
 
-class TestBinaryDetection:
-    """Parametrized tests for binary file detection."""
-    
-    @pytest.mark.parametrize("filename,content,expected", BINARY_EXTENSION_CASES)
-    def test_binary_extensions(self, tmp_path, filename, content, expected):
-        """Test that files with binary extensions are detected as binary."""
-        binary_file = tmp_path / filename
-        binary_file.write_bytes(content)
-        assert is_binary_file(binary_file) == expected, f"Failed for {filename}"
-    
-    @pytest.mark.parametrize("filename,content,expected", TEXT_EXTENSION_CASES)
-    def test_text_extensions(self, tmp_path, filename, content, expected):
-        """Test that files with text extensions are not detected as binary."""
-        text_file = tmp_path / filename
-        text_file.write_text(content)
-        assert is_binary_file(text_file) == expected, f"Failed for {filename}"
-    
-    @pytest.mark.parametrize("filename,content,expected", BINARY_CONTENT_CASES)
-    def test_binary_content_detection(self, tmp_path, filename, content, expected):
-        """Test binary detection based on file content."""
-        test_file = tmp_path / filename
-        
+@pytest.fixture(scope="session")
+def binary_corpus(tmp_path_factory):
+    """Materialize every binary-detection case file once per session.
+
+    Returns:
+        Dictionary mapping each case filename to its Path on disk
+    """
+    corpus_dir = tmp_path_factory.mktemp("binary_corpus")
+    corpus = {}
+    for filename, content, _ in (
+        BINARY_EXTENSION_CASES + TEXT_EXTENSION_CASES + BINARY_CONTENT_CASES
+    ):
+        path = corpus_dir / filename
         if isinstance(content, bytes):
-            test_file.write_bytes(content)
+            path.write_bytes(content)
         else:
-            test_file.write_text(content)
-        
-        assert is_binary_file(test_file) == expected, f"Failed for {filename}"
+            path.write_text(content)
+        corpus[filename] = path
+    return corpus
+
+
+@pytest.mark.parametrize("filename,content,expected", BINARY_EXTENSION_CASES)
+def test_binary_extensions(binary_corpus, filename, content, expected):
+    """Test that files with binary extensions are detected as binary."""
+    assert is_binary_file(binary_corpus[filename]) == expected
+
+
+@pytest.mark.parametrize("filename,content,expected", TEXT_EXTENSION_CASES)
+def test_text_extensions(binary_corpus, filename, content, expected):
+    """Test that files with text extensions are not detected as binary."""
+    assert is_binary_file(binary_corpus[filename]) == expected
+
+
+@pytest.mark.parametrize("filename,content,expected", BINARY_CONTENT_CASES)
+def test_binary_content_detection(binary_corpus, filename, content, expected):
+    """Test binary detection based on file content."""
+    assert is_binary_file(binary_corpus[filename]) == expected
+
+
+@pytest.mark.parametrize(
+    "filename,content,expected",
+    [case for case in BINARY_EXTENSION_CASES + TEXT_EXTENSION_CASES + BINARY_CONTENT_CASES
+     if Path(case[0]).suffix not in CONTENT_PROCESSORS],
+)
+def test_dump_read_path_agrees_with_is_binary_file(binary_corpus, filename, content, expected):
+    """Test that get_file_content omits exactly the files is_binary_file flags."""
+    omitted = get_file_content(binary_corpus[filename])[0] == "[Binary file content omitted]\n"
+    assert omitted == expected
+
+
+def test_permission_error(tmp_path, monkeypatch):
+    """Test handling of files that can't be read."""
+    protected_file = tmp_path / "protected.txt"
+    protected_file.write_text("secret")
+    monkeypatch.setattr("builtins.open", MagicMock(side_effect=PermissionError))
     
-    def test_permission_error(self, tmp_path):
-        """Test handling of files that can't be read."""
-        protected_file = tmp_path / "protected.bin"
-        protected_file.touch()
-        os.chmod(protected_file, 0o000)
-        
-        try:
-            assert is_binary_file(protected_file)
-        finally:
-            os.chmod(protected_file, 0o644)
+    assert is_binary_file(protected_file)
+
+
+def test_binary_extension_skips_read(monkeypatch):
+    """Test that known binary extensions are decided without opening the file."""
+    monkeypatch.setattr("builtins.open", lambda *a, **k: pytest.fail("should not open"))
+    monkeypatch.setattr(os, "open", lambda *a, **k: pytest.fail("should not open"))
+    assert is_binary_file(Path("x.jpg"))
+    assert get_file_content(Path("x.PNG")) == ("[Binary file content omitted]\n", None)
 
 
 class TestEncodingDetection:
@@ -319,7 +382,7 @@ class TestProcessorGaps:
         from dumpcode.processors import get_file_content
         p = tmp_path / "bug.txt"
         p.touch()
-        with patch("builtins.open", side_effect=OSError("Drive Unplugged")):
+        with patch("os.read", side_effect=OSError("Drive Unplugged")):
             content, error = get_file_content(p)
             assert "Error reading file: Drive Unplugged" in content
             assert error == "Error reading file: Drive Unplugged"
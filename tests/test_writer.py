@@ -58,6 +58,19 @@ class TestDumpWriterNoXMLMode:
         assert "--- FILE: test.py ---" in output
         assert "content" in output
         # Do not check the bottom line of dashes; it's fragile boilerplate.
+
+    def test_write_file_streams_content_unconcatenated(self):
+        """Test that file content is handed to the stream without being re-joined."""
+        stream = io.StringIO()
+        writer = DumpWriter(stream, use_xml=False)
+        content = "x" * 4096
+        writes = []
+        stream.write = writes.append
+
+        writer.write_file("big.txt", content)
+
+        assert any(chunk is content for chunk in writes)
+        assert writer.total_chars == len("".join(writes))
     
     def test_write_tree_no_xml(self):
         """Test write_tree in --no-xml mode."""